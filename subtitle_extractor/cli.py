@@ -93,6 +93,12 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
                         help="Preview what would be extracted without writing files")
     parser.add_argument("--threads", type=positive_int, default=1,
                         help="Number of parallel threads (default: 1)")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="Parallel executor: threads (I/O-bound extraction) or "
+                             "processes (CPU-bound OCR/conversion) (default: thread)")
+    parser.add_argument("--sort-files", action="store_true",
+                        help="Process files in sorted order (deterministic reports; "
+                             "delays start until the directory walk completes)")
     parser.add_argument("--retries", type=int, default=0, metavar="N",
                         help="Retry failed extractions up to N times (default: 0)")
     parser.add_argument("--convert-to", choices=["srt", "ass"],
@@ -141,7 +147,7 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
     # --clear-resume: standalone action, no directory needed
     # ------------------------------------------------------------------
     if args.clear_resume:
-        resume_file = Path.home() / ".subtitle-extractor-resume.pkl"
+        resume_file = Path.home() / ".subtitle-extractor-resume.log"
         if resume_file.exists():
             resume_file.unlink()
             print(f"Cleared resume state: {resume_file}")
@@ -188,6 +194,8 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
         if args.sync_threshold != parser.get_default("sync_threshold")
         else config.get("sync_threshold", 0.5)
     )
+    sync_workers = config.get("sync_workers")
+    vad_backend = config.get("vad_backend")
 
     # ------------------------------------------------------------------
     # Tool availability checks
@@ -233,6 +241,8 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
         languages=languages,
         dry_run=dry_run,
         threads=threads,
+        executor_mode=args.executor,
+        sort_files=args.sort_files,
         include_forced=args.include_forced,
         include_sdh=args.include_sdh,
         exclude_commentary=args.exclude_commentary,
@@ -247,6 +257,8 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
         check_sync=check_sync,
         fix_sync=fix_sync,
         sync_threshold=sync_threshold,
+        sync_workers=sync_workers,
+        vad_backend=vad_backend,
     )
 
     logging.info(f"Extracting subtitles for: {', '.join(extractor.target_languages)}\n")
@@ -257,11 +269,10 @@ Config file: create ~/.subtitle-extractor.yaml with default settings.
     if args.list_tracks:
         logging.info("=== TRACK INSPECTION MODE ===\n")
         directory = args.directory
-        mkv_files = sorted(directory.rglob("*.mkv"))
-        ffmpeg_files: list = []
+        video_files = list(directory.rglob("*.mkv"))
         for ext in ("*.mp4", "*.webm", "*.mov", "*.avi"):
-            ffmpeg_files.extend(directory.rglob(ext))
-        video_files = sorted(mkv_files + sorted(ffmpeg_files))
+            video_files.extend(directory.rglob(ext))
+        video_files.sort()
 
         if not video_files:
             logging.info(f"No video files found in {directory}")
@@ -2,8 +2,9 @@
 
 import logging
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
     import yaml
@@ -11,25 +12,89 @@ try:
 except ImportError:
     HAS_YAML = False
 
-# Valid configuration keys and their expected Python types.
-_VALID_KEYS: Dict[str, type] = {
-    "languages": list,
-    "overwrite": bool,
-    "dry_run": bool,
-    "threads": int,
-    "retries": int,
-    "output_dir": str,
-    "preserve_structure": bool,
-    "convert_to": str,
-    "check_sync": bool,
-    "fix_sync": bool,
-    "sync_threshold": float,
+_CONVERT_TO_VALUES = {"srt", "ass"}
+
+# ffsubsync's --vad choices.
+_VAD_BACKENDS = {
+    "subs_then_webrtc", "webrtc", "subs_then_auditok", "auditok",
+    "subs_then_silero", "silero",
 }
 
-# Keys that accept both int and float values (e.g. `sync_threshold: 1` in YAML).
-_NUMERIC_KEYS: frozenset = frozenset({"sync_threshold"})
 
-_CONVERT_TO_VALUES = {"srt", "ass"}
+# Exact type predicates. isinstance is the wrong tool here: bool is a
+# subclass of int, so `threads: true` would slip through an isinstance
+# check, and the exact `type(v) in (...)` test also skips the MRO walk.
+def _is_bool(value: Any) -> bool:
+    return value is True or value is False
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float)
+
+
+def _is_str(value: Any) -> bool:
+    return type(value) is str
+
+
+def _is_list(value: Any) -> bool:
+    return type(value) is list
+
+
+def _check_min_workers(key: str, value: int) -> Optional[str]:
+    if value < 1:
+        return f"'{key}' must be >= 1, got {value}"
+    return None
+
+
+def _check_convert_to(value: str) -> Optional[str]:
+    if value not in _CONVERT_TO_VALUES:
+        return f"'convert_to' must be one of {sorted(_CONVERT_TO_VALUES)}, got '{value}'"
+    return None
+
+
+def _check_output_dir(value: str) -> Optional[str]:
+    p = Path(value)
+    if p.exists() and not p.is_dir():
+        return f"'output_dir' exists but is not a directory: {value}"
+    return None
+
+
+def _check_vad_backend(value: str) -> Optional[str]:
+    if value not in _VAD_BACKENDS:
+        return f"'vad_backend' must be one of {sorted(_VAD_BACKENDS)}, got '{value}'"
+    return None
+
+
+def _check_sync_threshold(value: float) -> Optional[str]:
+    if value < 0:
+        return f"'sync_threshold' must be >= 0, got {value}"
+    return None
+
+
+# Key → (type predicate, human-readable type label, optional value check).
+# One dict lookup plus two predicate calls per key replaces the per-key
+# branch ladder validate_config used to grow with every new setting; value
+# checks return the error message directly so their wording stays per-key.
+_SCHEMA: Dict[str, Tuple[Callable[[Any], bool], str, Optional[Callable[[Any], Optional[str]]]]] = {
+    "languages": (_is_list, "list", None),
+    "overwrite": (_is_bool, "bool", None),
+    "dry_run": (_is_bool, "bool", None),
+    "threads": (_is_int, "int", partial(_check_min_workers, "threads")),
+    "retries": (_is_int, "int", None),
+    "output_dir": (_is_str, "str", _check_output_dir),
+    "preserve_structure": (_is_bool, "bool", None),
+    "convert_to": (_is_str, "str", _check_convert_to),
+    "check_sync": (_is_bool, "bool", None),
+    "fix_sync": (_is_bool, "bool", None),
+    # Both int and float are accepted (YAML parses `1` as int).
+    "sync_threshold": (_is_number, "a number", _check_sync_threshold),
+    "sync_workers": (_is_int, "int", partial(_check_min_workers, "sync_workers")),
+    "vad_backend": (_is_str, "str", _check_vad_backend),
+}
 
 
 def validate_config(config: Dict[str, Any]) -> None:
@@ -41,46 +106,20 @@ def validate_config(config: Dict[str, Any]) -> None:
     errors = []
 
     for key, value in config.items():
-        if key not in _VALID_KEYS:
+        spec = _SCHEMA.get(key)
+        if spec is None:
             errors.append(
-                f"Unknown key '{key}'. Valid keys: {', '.join(sorted(_VALID_KEYS))}"
+                f"Unknown key '{key}'. Valid keys: {', '.join(sorted(_SCHEMA))}"
             )
             continue
-
-        expected = _VALID_KEYS[key]
-        # Numeric keys accept both int and float (e.g. `sync_threshold: 1` in YAML).
-        if key in _NUMERIC_KEYS:
-            if not isinstance(value, (int, float)):
-                errors.append(
-                    f"'{key}' must be a number, got {type(value).__name__}"
-                )
-        elif not isinstance(value, expected):
-            errors.append(
-                f"'{key}' must be {expected.__name__}, got {type(value).__name__}"
-            )
-
-    # Value-level checks (only when the type already passed).
-    threads = config.get("threads")
-    if isinstance(threads, int) and threads < 1:
-        errors.append(f"'threads' must be >= 1, got {threads}")
-
-    convert_to = config.get("convert_to")
-    if isinstance(convert_to, str) and convert_to not in _CONVERT_TO_VALUES:
-        errors.append(
-            f"'convert_to' must be one of {sorted(_CONVERT_TO_VALUES)}, got '{convert_to}'"
-        )
-
-    output_dir = config.get("output_dir")
-    if isinstance(output_dir, str):
-        p = Path(output_dir)
-        if p.exists() and not p.is_dir():
-            errors.append(
-                f"'output_dir' exists but is not a directory: {output_dir}"
-            )
-
-    sync_threshold = config.get("sync_threshold")
-    if isinstance(sync_threshold, (int, float)) and sync_threshold < 0:
-        errors.append(f"'sync_threshold' must be >= 0, got {sync_threshold}")
+        type_ok, label, check = spec
+        if not type_ok(value):
+            errors.append(f"'{key}' must be {label}, got {type(value).__name__}")
+            continue
+        if check is not None:
+            error = check(value)
+            if error is not None:
+                errors.append(error)
 
     if errors:
         print("Configuration error(s):", file=sys.stderr)
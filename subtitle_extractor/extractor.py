@@ -1,18 +1,41 @@
 """Core subtitle extraction logic."""
 
 import csv
+import itertools
+import statistics
 import json
 import logging
-import pickle
+import os
+import re
+import shutil
+import sqlite3
 import subprocess
+import sys
 import threading
+import multiprocessing
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from array import array
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple,
+    Optional, Set, Tuple,
+)
+
+if TYPE_CHECKING:
+    from . import sync as sync_mod
 
 try:
+    from rich.console import Console
     from rich.progress import (
         BarColumn,
         Progress,
@@ -21,10 +44,68 @@ try:
         TextColumn,
         TimeRemainingColumn,
     )
+    from rich.table import Table
     HAS_RICH = True
 except ImportError:
     HAS_RICH = False
 
+# Report serialization: orjson (C extension) when installed, stdlib json
+# otherwise. Report entries are flat dicts of str/int/list, which both
+# serialize identically.
+try:
+    import orjson
+
+    def _json_dumps(obj: Dict) -> str:
+        """Serialize one report object to a JSON string (orjson fast path)."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj: Dict) -> str:
+        """Serialize one report object to a JSON string (stdlib fallback)."""
+        return json.dumps(obj)
+
+
+# Track-listing table layout: (header, style, width). Fixed for the whole
+# run, so display_track_list only adds rows per file.
+_TRACK_TABLE_COLUMNS = (
+    ("ID", "cyan", 6),
+    ("Language", "green", 10),
+    ("Codec", "yellow", 15),
+    ("Forced", None, 8),
+    ("Track Name", None, 25),
+    ("Will Extract?", None, 15),
+)
+
+# Shared Console for track listings, created on first use.
+_console = None
+
+
+def _get_console() -> "Console":
+    """Return the cached rich Console (requires HAS_RICH)."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+def _build_track_table() -> "Table":
+    """Return a fresh track-listing Table with the standard columns."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for header, style, width in _TRACK_TABLE_COLUMNS:
+        table.add_column(header, style=style, width=width)
+    return table
+
+
+# SRT cue header ("N\n00:...") sniff for the tiny-subtitle sync guard.
+_SRT_CUE_RE = re.compile(rb"^\d+\r?\n\d{2}:", re.M)
+
+
+class TrackDecision(NamedTuple):
+    """Outcome of the fused per-track extract/skip evaluation."""
+
+    would_extract: bool
+    skip_reason: str
+    normalized_language: str
+
 
 class SubtitleExtractor:
     """Handles extraction of subtitles from MKV, MP4, WebM, MOV, and AVI files."""
@@ -38,6 +119,13 @@ class SubtitleExtractor:
     # Supported ffmpeg formats (non-MKV).
     FFMPEG_FORMATS: Set[str] = {".mp4", ".webm", ".mov", ".avi"}
 
+    # Recognised sidecar subtitle extensions.
+    SUBTITLE_EXTENSIONS: Tuple[str, ...] = (".srt", ".ass", ".sup", ".sub", ".ssa")
+
+    # Image-based subtitle file suffixes (no text timestamps to shift or
+    # sync-check).  Frozenset so membership tests hash instead of scanning.
+    IMAGE_SUB_SUFFIXES: FrozenSet[str] = frozenset({".sup", ".sub", ".idx"})
+
     # Codec identifier → file extension.  Exact (case-insensitive) match is
     # attempted first; substring fallback is used for codec strings that embed
     # extra metadata (e.g. "SubRip/SRT").
@@ -89,12 +177,45 @@ class SubtitleExtractor:
     # Upper bound for numbered subtitle file detection.
     MAX_SUBTITLE_TRACK_INDEX: int = 20
 
+    # Floors below which a subtitle is not worth a sync check: a VAD pass
+    # over the whole video for a near-empty forced-narrative track is pure
+    # overhead (see _run_sync_check).
+    MIN_SYNC_SUB_BYTES: int = 256
+    MIN_SYNC_SUB_CUES: int = 3
+
+    # Resolved absolute tool paths, cached so subprocess spawns skip the
+    # per-call PATH search (see _tool).
+    _TOOLS: Dict[str, str] = {}
+
+    # No per-instance __dict__: attribute access goes through fixed slot
+    # offsets, and process-mode runs that build one extractor per worker
+    # skip the dict allocation. New attributes must be added here.
+    __slots__ = (
+        "overwrite", "dry_run", "threads", "executor_mode", "sort_files",
+        "include_forced", "include_sdh", "exclude_commentary", "track_title",
+        "log_file", "report_format", "convert_to", "output_dir",
+        "preserve_structure", "resume", "resume_file", "probe_cache_file",
+        "retries", "check_sync", "fix_sync", "sync_threshold", "sync_workers",
+        "vad_backend", "target_languages", "_target_tuple",
+        "_existing_sub_suffixes", "stats", "total_files", "current_file",
+        "start_time", "end_time", "start_ns", "end_ns", "processed_files",
+        "_resume_fh", "extraction_log", "_report_fh", "_report_writer",
+        "_report_path", "_report_first_entry", "_lock", "_local",
+        "_sync_mod", "_sync_available", "_sync_check", "_sync_apply",
+        "_sync_fix", "_sync_offsets", "_sync_confs", "_probe_conn", "_probe_cache_failed", "_dir_names",
+        "_srt_stems_by_dir", "_sup_files", "_found_mkv", "_found_other",
+        "base_directory", "use_rich", "_render_tracks", "progress_bar",
+        "progress_task", "sync_backend",
+    )
+
     def __init__(
         self,
         overwrite: bool = False,
         languages: Optional[List[str]] = None,
         dry_run: bool = False,
         threads: int = 1,
+        executor_mode: str = "thread",
+        sort_files: bool = False,
         include_forced: bool = False,
         include_sdh: bool = False,
         exclude_commentary: bool = False,
@@ -106,14 +227,20 @@ class SubtitleExtractor:
         preserve_structure: bool = False,
         resume: bool = False,
         resume_file: Optional[Path] = None,
+        probe_cache_file: Optional[Path] = None,
         retries: int = 0,
         check_sync: bool = False,
         fix_sync: bool = False,
         sync_threshold: float = 0.5,
+        sync_workers: Optional[int] = None,
+        vad_backend: Optional[str] = None,
+        sync_backend: Optional["sync_mod.SyncBackend"] = None,
     ) -> None:
         self.overwrite = overwrite
         self.dry_run = dry_run
         self.threads = threads
+        self.executor_mode = executor_mode
+        self.sort_files = sort_files
         self.include_forced = include_forced
         self.include_sdh = include_sdh
         self.exclude_commentary = exclude_commentary
@@ -124,16 +251,43 @@ class SubtitleExtractor:
         self.output_dir = output_dir
         self.preserve_structure = preserve_structure
         self.resume = resume
-        self.resume_file = resume_file or Path.home() / ".subtitle-extractor-resume.pkl"
+        self.resume_file = resume_file or Path.home() / ".subtitle-extractor-resume.log"
+        self.probe_cache_file = (
+            probe_cache_file or Path.home() / ".subtitle-extractor-probe.sqlite"
+        )
         self.retries = max(0, retries)
         self.check_sync = check_sync
         self.fix_sync = fix_sync
         self.sync_threshold = max(0.0, float(sync_threshold))
+        # Sync checks are CPU-bound inside ffsubsync's VAD pass, so the
+        # batch helper (run_sync_checks) defaults to half the cores.
+        self.sync_workers = sync_workers or max(1, (os.cpu_count() or 2) // 2)
+        # Passed through to ffsubsync's --vad; None keeps its default.
+        self.vad_backend = vad_backend
+        # Optional SyncBackend override; None means the ffsubsync-backed
+        # module functions (bound lazily in _run_sync_check).
+        self.sync_backend = sync_backend
 
         # Normalise and store target languages (default to English).
         self.target_languages: List[str] = self._normalize_languages(
             languages if languages is not None else ["en"]
         )
+        # Hashable form for the memoized language-match helper.
+        self._target_tuple: Tuple[str, ...] = tuple(self.target_languages)
+
+        # Suffix candidates for _check_existing_subtitles. The
+        # (language, extension, index) matrix is fixed for an extractor
+        # instance; only the video stem varies per file.
+        self._existing_sub_suffixes: List[str] = [
+            f".{lang}{ext}"
+            for lang in self.target_languages
+            for ext in self.SUBTITLE_EXTENSIONS
+        ] + [
+            f".{lang}.{i}{ext}"
+            for lang in self.target_languages
+            for i in range(1, self.MAX_SUBTITLE_TRACK_INDEX + 1)
+            for ext in self.SUBTITLE_EXTENSIONS
+        ]
 
         self.stats: Dict[str, int] = {
             "processed": 0,
@@ -141,26 +295,97 @@ class SubtitleExtractor:
             "skipped": 0,
             "errors": 0,
             "sync_issues": 0,
+            "sync_skipped_tiny": 0,
         }
 
         self.total_files: int = 0
         self.current_file: int = 0
+        # Wall-clock datetimes are kept for the user-facing Started/Finished
+        # lines; durations are measured on the monotonic clock, which is
+        # immune to NTP steps and far cheaper than building datetime objects.
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
 
         self.processed_files: Set[str] = set()
+        self._resume_fh = None
         if self.resume and self.resume_file.exists():
             self._load_resume_state()
 
+        # Per-file results: streamed straight to the report file when a
+        # report format is configured, otherwise buffered here.
         self.extraction_log: List[Dict] = []
+        self._report_fh = None
+        self._report_writer = None
+        self._report_path: Optional[Path] = None
+        self._report_first_entry = True
 
         self._lock = threading.Lock()
+        # Per-thread stats deltas, merged under the lock once per file
+        # (see _bump / process_video_file).
+        self._local = threading.local()
+
+        # Sync module, imported on first _run_sync_check (keeps startup
+        # cheap when sync checking is disabled). Availability and the
+        # check/apply/fix callables are bound once on that first call so
+        # the per-file path dispatches through locals instead of re-reading
+        # module globals (same strategy binding as _render_tracks).
+        self._sync_mod = None
+        self._sync_available: Optional[bool] = None
+        self._sync_check = None
+        self._sync_apply = None
+        self._sync_fix = None
+        # Measured (offset, confidence) pairs as packed doubles — 8 bytes
+        # per value instead of a list of tuples — for the summary's offset
+        # distribution. Appends happen under the GIL; process-mode workers
+        # keep their own arrays (only integer stats cross the boundary).
+        self._sync_offsets = array("d")
+        self._sync_confs = array("d")
+
+        # Lazily-opened SQLite probe cache (see _probe_connection).
+        self._probe_conn: Optional[sqlite3.Connection] = None
+        self._probe_cache_failed: bool = False
+
+        # Side tables populated by the discovery walk (_iter_video_files):
+        # per-directory subtitle names (so _check_existing_subtitles never
+        # re-lists a walked directory), per-directory .srt stems, and the
+        # sidecar .sup files for OCR.
+        self._dir_names: Dict[str, Set[str]] = {}
+        self._srt_stems_by_dir: Dict[str, Set[str]] = {}
+        self._sup_files: List[Path] = []
+        self._found_mkv: int = 0
+        self._found_other: int = 0
 
         # Rich progress bar is disabled when logging to file (output clash).
         self.use_rich: bool = HAS_RICH and not log_file
+        # Track-list renderer picked once; display_track_list just
+        # dispatches (see _render_tracks_rich/_render_tracks_plain).
+        self._render_tracks = (
+            self._render_tracks_rich if HAS_RICH else self._render_tracks_plain
+        )
         self.progress_bar: Optional[Progress] = None
         self.progress_task: Optional[object] = None
 
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _bump(self, key: str, amount: int = 1) -> None:
+        """Increment a stats counter.
+
+        While a file is being processed the increment goes into that thread's
+        local delta and is merged into ``self.stats`` once at the end of
+        ``process_video_file``, so workers touch the shared lock once per
+        file instead of once per counter update.
+        """
+        delta = getattr(self._local, "stats_delta", None)
+        if delta is not None:
+            delta[key] += amount
+        else:
+            with self._lock:
+                self.stats[key] += amount
+
     # ------------------------------------------------------------------
     # Language helpers
     # ------------------------------------------------------------------
@@ -174,34 +399,63 @@ class SubtitleExtractor:
         return sorted(normalized)
 
     def _matches_language(self, lang_code: str) -> Tuple[bool, str]:
-        """Return ``(matches, normalized_code)`` for *lang_code*."""
+        """Return ``(matches, normalized_code)`` for *lang_code*.
+
+        The same handful of codes (eng, und, es, …) recur across every
+        track in a library, so results are memoized per
+        ``(code, target set)`` pair (see _match_language_cached).
+        """
         if not lang_code:
             return False, ""
-        lang_lower = lang_code.lower()
-        normalized = self.LANGUAGE_CODES.get(lang_lower, lang_lower)
-        return normalized in self.target_languages, normalized
+        return _match_language_cached(lang_code.lower(), self._target_tuple)
 
     # ------------------------------------------------------------------
     # Track filtering
     # ------------------------------------------------------------------
 
+    def _evaluate_track(self, track: Dict) -> TrackDecision:
+        """Evaluate the language and skip filters for *track* in one pass.
+
+        Predicates run cheapest-first and short-circuit: a language
+        mismatch returns immediately, so the track name is lowercased and
+        the forced/SDH/commentary filters consulted only for tracks in a
+        target language.
+        """
+        language = track.get("language", "")
+        matches, normalized = self._matches_language(language)
+        if not matches:
+            return TrackDecision(False, "language mismatch", language or "und")
+        should_skip, reason = self._should_skip_track_lc(
+            track.get("forced", False), track.get("track_name", "").lower()
+        )
+        return TrackDecision(not should_skip, reason, normalized)
+
     def _should_skip_track(self, track: Dict) -> Tuple[bool, str]:
         """Return ``(should_skip, reason)`` for a subtitle track dict."""
-        track_name = track.get("track_name", "").lower()
+        return self._should_skip_track_lc(
+            track.get("forced", False), track.get("track_name", "").lower()
+        )
+
+    def _should_skip_track_lc(self, forced: bool, name_lc: str) -> Tuple[bool, str]:
+        """Skip check against a pre-lowercased track name.
 
-        is_forced = track.get("forced", False) or "forced" in track_name
+        The discovery loops lowercase each track name exactly once and call
+        this directly, so the substring tests below never re-run ``.lower()``
+        per predicate.
+        """
+        is_forced = forced or "forced" in name_lc
         if not self.include_forced and is_forced and not self.include_sdh:
             return True, "forced subtitle"
 
-        is_sdh = "sdh" in track_name or "hearing impaired" in track_name or "cc" in track_name
+        is_sdh = "sdh" in name_lc or "hearing impaired" in name_lc or "cc" in name_lc
         if not self.include_sdh and is_sdh:
             return True, "SDH/CC subtitle"
 
-        is_commentary = "commentary" in track_name or "comment" in track_name
+        is_commentary = "commentary" in name_lc or "comment" in name_lc
         if self.exclude_commentary and is_commentary:
             return True, "commentary track"
 
-        if self.track_title and self.track_title.lower() not in track_name:
+        if self.track_title and self.track_title.lower() not in name_lc:
             return True, f"track title filter (looking for '{self.track_title}')"
 
         return False, ""
@@ -210,31 +464,44 @@ class SubtitleExtractor:
     # Tool availability checks
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def check_mkvtoolnix() -> bool:
+    @classmethod
+    def _tool(cls, name: str) -> str:
+        """Return the cached absolute path for *name* (falls back to the bare name).
+
+        Resolving via shutil.which once means every subsequent subprocess
+        spawn passes an absolute path and skips the exec-time PATH walk.
+        """
+        path = cls._TOOLS.get(name)
+        if path is None:
+            path = shutil.which(name) or name
+            cls._TOOLS[name] = path
+        return path
+
+    @classmethod
+    def check_mkvtoolnix(cls) -> bool:
         """Return True if mkvtoolnix (mkvmerge + mkvextract) is available."""
         try:
-            subprocess.run(["mkvmerge", "--version"], capture_output=True, check=True)
-            subprocess.run(["mkvextract", "--version"], capture_output=True, check=True)
+            subprocess.run([cls._tool("mkvmerge"), "--version"], capture_output=True, check=True)
+            subprocess.run([cls._tool("mkvextract"), "--version"], capture_output=True, check=True)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
-    @staticmethod
-    def check_ffmpeg() -> bool:
+    @classmethod
+    def check_ffmpeg(cls) -> bool:
         """Return True if ffmpeg and ffprobe are available."""
         try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-            subprocess.run(["ffprobe", "-version"], capture_output=True, check=True)
+            subprocess.run([cls._tool("ffmpeg"), "-version"], capture_output=True, check=True)
+            subprocess.run([cls._tool("ffprobe"), "-version"], capture_output=True, check=True)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
-    @staticmethod
-    def check_pgsrip() -> bool:
+    @classmethod
+    def check_pgsrip(cls) -> bool:
         """Return True if pgsrip (OCR tool) is available."""
         try:
-            subprocess.run(["pgsrip", "--help"], capture_output=True)
+            subprocess.run([cls._tool("pgsrip"), "--help"], capture_output=True)
             return True
         except FileNotFoundError:
             return False
@@ -300,22 +567,35 @@ class SubtitleExtractor:
     # ------------------------------------------------------------------
 
     def _load_resume_state(self) -> None:
-        """Load previously processed file paths from the resume pickle."""
+        """Replay the append-only resume log into ``processed_files``."""
         try:
-            with open(self.resume_file, "rb") as fh:
-                self.processed_files = pickle.load(fh)
+            with open(self.resume_file, encoding="utf-8") as fh:
+                self.processed_files = {line.rstrip("\n") for line in fh if line.strip()}
             logging.info(f"Resumed: {len(self.processed_files)} files already processed")
-        except (FileNotFoundError, EOFError, pickle.UnpicklingError) as exc:
+        except OSError as exc:
             logging.warning(f"Could not load resume state: {exc}")
             self.processed_files = set()
 
-    def _save_resume_state(self) -> None:
-        """Persist processed file paths to the resume pickle."""
+    def _open_resume_log(self) -> None:
+        """Open the resume log for appending.
+
+        One flushed line per completed file makes progress durable as the
+        run goes (a killed run resumes where it stopped) and removes the
+        whole-set serialization that used to happen at the end.
+        """
         try:
-            with open(self.resume_file, "wb") as fh:
-                pickle.dump(self.processed_files, fh)
+            self._resume_fh = open(self.resume_file, "a", encoding="utf-8")
         except OSError as exc:
-            logging.warning(f"Could not save resume state: {exc}")
+            logging.warning(f"Could not open resume log: {exc}")
+            self._resume_fh = None
+
+    def _mark_processed(self, file_key: str) -> None:
+        """Record *file_key* as processed, both in memory and on disk."""
+        with self._lock:
+            self.processed_files.add(file_key)
+            if self._resume_fh is not None:
+                self._resume_fh.write(file_key + "\n")
+                self._resume_fh.flush()
 
     # ------------------------------------------------------------------
     # Progress bar
@@ -354,55 +634,129 @@ class SubtitleExtractor:
             )
 
     # ------------------------------------------------------------------
-    # Track discovery
+    # Probe cache
     # ------------------------------------------------------------------
 
-    def get_subtitle_tracks(self, mkv_file: Path) -> List[Dict]:
-        """Return filtered subtitle tracks from an MKV file (via mkvmerge)."""
+    def _probe_connection(self) -> Optional[sqlite3.Connection]:
+        """Return the (lazily opened) SQLite probe-cache connection.
+
+        Probe output (``mkvmerge -J`` / ``ffprobe``) is stable for a given
+        ``(path, mtime, size)`` tuple, so results are persisted across runs.
+        Returns ``None`` when the cache cannot be opened; callers then fall
+        back to probing directly.
+        """
+        if self._probe_cache_failed:
+            return None
+        if self._probe_conn is None:
+            try:
+                conn = sqlite3.connect(
+                    str(self.probe_cache_file),
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS probe ("
+                    "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, json BLOB)"
+                )
+                self._probe_conn = conn
+            except sqlite3.Error as exc:
+                logging.debug(f"Probe cache unavailable: {exc}")
+                self._probe_cache_failed = True
+                return None
+        return self._probe_conn
+
+    def _probe_lookup(self, video_file: Path) -> Optional[Dict]:
+        """Return cached probe JSON for *video_file*, or None on miss."""
+        conn = self._probe_connection()
+        if conn is None:
+            return None
         try:
-            result = subprocess.run(
-                ["mkvmerge", "-J", str(mkv_file)],
-                capture_output=True, text=True, check=True,
-            )
+            stat = video_file.stat()
+            with self._lock:
+                row = conn.execute(
+                    "SELECT mtime, size, json FROM probe WHERE path = ?",
+                    (str(video_file.absolute()),),
+                ).fetchone()
+            if row and row[0] == stat.st_mtime and row[1] == stat.st_size:
+                return json.loads(row[2])
+        except (OSError, sqlite3.Error, json.JSONDecodeError) as exc:
+            logging.debug(f"Probe cache lookup failed for {video_file}: {exc}")
+        return None
+
+    def _probe_store(self, video_file: Path, raw_json: str) -> None:
+        """Persist probe output for *video_file* keyed by (path, mtime, size)."""
+        conn = self._probe_connection()
+        if conn is None:
+            return
+        try:
+            stat = video_file.stat()
+            with self._lock:
+                conn.execute(
+                    "INSERT OR REPLACE INTO probe (path, mtime, size, json) "
+                    "VALUES (?, ?, ?, ?)",
+                    (str(video_file.absolute()), stat.st_mtime, stat.st_size, raw_json),
+                )
+        except (OSError, sqlite3.Error) as exc:
+            logging.debug(f"Probe cache store failed for {video_file}: {exc}")
+
+    def _probe_file(self, video_file: Path, cmd: List[str]) -> Optional[Dict]:
+        """Run a probe command (or serve its cached output) and parse the JSON."""
+        cached = self._probe_lookup(video_file)
+        if cached is not None:
+            return cached
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             data = json.loads(result.stdout)
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as exc:
+        except (subprocess.SubprocessError, json.JSONDecodeError) as exc:
             logging.error(f"  Error reading tracks: {exc}")
+            return None
+        self._probe_store(video_file, result.stdout)
+        return data
+
+    # ------------------------------------------------------------------
+    # Track discovery
+    # ------------------------------------------------------------------
+
+    def get_subtitle_tracks(self, mkv_file: Path) -> List[Dict]:
+        """Return filtered subtitle tracks from an MKV file (via mkvmerge)."""
+        data = self._probe_file(mkv_file, [self._tool("mkvmerge"), "-J", str(mkv_file)])
+        if data is None:
             return []
 
+        # Single filtering pass, cheapest predicate first: track type, then
+        # language, then name-based skip checks on one pre-lowercased string.
         matching: List[Dict] = []
         for track in data.get("tracks", []):
             if track["type"] != "subtitles":
                 continue
             props = track.get("properties", {})
-            lang_code = props.get("language", "")
-            matches, normalized = self._matches_language(lang_code)
+            matches, normalized = self._matches_language(props.get("language", ""))
             if not matches:
                 continue
-            track_info: Dict = {
+            track_name = props.get("track_name", "")
+            forced = props.get("forced_track", False)
+            should_skip, reason = self._should_skip_track_lc(forced, track_name.lower())
+            if should_skip:
+                logging.debug(f"Skipping track {track['id']}: {reason}")
+                continue
+            matching.append({
                 "id": track["id"],
                 "codec": track["codec"],
-                "track_name": props.get("track_name", ""),
+                "track_name": track_name,
                 "language": normalized,
-                "forced": props.get("forced_track", False),
-            }
-            should_skip, reason = self._should_skip_track(track_info)
-            if not should_skip:
-                matching.append(track_info)
-            else:
-                logging.debug(f"Skipping track {track['id']}: {reason}")
+                "forced": forced,
+            })
         return matching
 
     def get_subtitle_tracks_mp4(self, mp4_file: Path) -> List[Dict]:
         """Return filtered subtitle tracks from an MP4/ffmpeg file (via ffprobe)."""
-        try:
-            result = subprocess.run(
-                ["ffprobe", "-v", "quiet", "-print_format", "json",
-                 "-show_streams", str(mp4_file)],
-                capture_output=True, text=True, check=True,
-            )
-            data = json.loads(result.stdout)
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as exc:
-            logging.error(f"  Error reading tracks: {exc}")
+        data = self._probe_file(
+            mp4_file,
+            [self._tool("ffprobe"), "-v", "quiet", "-print_format", "json",
+             "-show_streams", str(mp4_file)],
+        )
+        if data is None:
             return []
 
         matching: List[Dict] = []
@@ -414,31 +768,25 @@ class SubtitleExtractor:
             matches, normalized = self._matches_language(lang_code)
             if not matches:
                 continue
-            disposition = stream.get("disposition", {})
-            track_info: Dict = {
+            track_name = tags.get("title", tags.get("TITLE", ""))
+            forced = stream.get("disposition", {}).get("forced", 0) == 1
+            should_skip, reason = self._should_skip_track_lc(forced, track_name.lower())
+            if should_skip:
+                logging.debug(f"Skipping stream {stream['index']}: {reason}")
+                continue
+            matching.append({
                 "id": stream["index"],
                 "codec": stream.get("codec_name", "unknown"),
-                "track_name": tags.get("title", tags.get("TITLE", "")),
+                "track_name": track_name,
                 "language": normalized,
-                "forced": disposition.get("forced", 0) == 1,
-            }
-            should_skip, reason = self._should_skip_track(track_info)
-            if not should_skip:
-                matching.append(track_info)
-            else:
-                logging.debug(f"Skipping stream {stream['index']}: {reason}")
+                "forced": forced,
+            })
         return matching
 
     def _get_all_subtitle_tracks_mkv(self, mkv_file: Path) -> List[Dict]:
         """Return ALL subtitle tracks from an MKV file (no language filtering)."""
-        try:
-            result = subprocess.run(
-                ["mkvmerge", "-J", str(mkv_file)],
-                capture_output=True, text=True, check=True,
-            )
-            data = json.loads(result.stdout)
-        except (subprocess.SubprocessError, json.JSONDecodeError, KeyError) as exc:
-            logging.error(f"Error reading tracks: {exc}")
+        data = self._probe_file(mkv_file, [self._tool("mkvmerge"), "-J", str(mkv_file)])
+        if data is None:
             return []
 
         tracks: List[Dict] = []
@@ -457,15 +805,12 @@ class SubtitleExtractor:
 
     def _get_all_subtitle_tracks_ffmpeg(self, video_file: Path) -> List[Dict]:
         """Return ALL subtitle tracks from an ffmpeg-supported file (no filtering)."""
-        try:
-            result = subprocess.run(
-                ["ffprobe", "-v", "quiet", "-print_format", "json",
-                 "-show_streams", str(video_file)],
-                capture_output=True, text=True, check=True,
-            )
-            data = json.loads(result.stdout)
-        except (subprocess.SubprocessError, json.JSONDecodeError, KeyError) as exc:
-            logging.error(f"Error reading tracks: {exc}")
+        data = self._probe_file(
+            video_file,
+            [self._tool("ffprobe"), "-v", "quiet", "-print_format", "json",
+             "-show_streams", str(video_file)],
+        )
+        if data is None:
             return []
 
         tracks: List[Dict] = []
@@ -494,7 +839,7 @@ class SubtitleExtractor:
         for attempt in range(self.retries + 1):
             try:
                 subprocess.run(
-                    ["mkvextract", str(mkv_file), "tracks", f"{track_id}:{output_file}"],
+                    [self._tool("mkvextract"), str(mkv_file), "tracks", f"{track_id}:{output_file}"],
                     capture_output=True, check=True,
                 )
                 return True
@@ -517,7 +862,7 @@ class SubtitleExtractor:
         for attempt in range(self.retries + 1):
             try:
                 subprocess.run(
-                    ["ffmpeg", "-y", "-v", "quiet", "-i", str(mp4_file),
+                    [self._tool("ffmpeg"), "-y", "-v", "quiet", "-i", str(mp4_file),
                      "-map", f"0:{track_id}", "-c", "copy", str(output_file)],
                     capture_output=True, check=True,
                 )
@@ -549,7 +894,8 @@ class SubtitleExtractor:
         if not self.convert_to or input_file.suffix.lstrip(".") == self.convert_to:
             return True
 
-        is_image = self._is_image_based_codec(source_codec) or input_file.suffix in (".sup", ".sub")
+        is_image = (self._is_image_based_codec(source_codec)
+                    or input_file.suffix.lower() in self.IMAGE_SUB_SUFFIXES)
 
         if is_image and self.convert_to == "srt":
             return self._ocr_convert(input_file, output_file)
@@ -562,7 +908,7 @@ class SubtitleExtractor:
 
         try:
             subprocess.run(
-                ["ffmpeg", "-y", "-i", str(input_file), str(output_file)],
+                [self._tool("ffmpeg"), "-y", "-i", str(input_file), str(output_file)],
                 capture_output=True, check=True,
             )
             if output_file.exists() and input_file != output_file:
@@ -584,7 +930,7 @@ class SubtitleExtractor:
 
         try:
             result = subprocess.run(
-                ["pgsrip", str(input_file)],
+                [self._tool("pgsrip"), str(input_file)],
                 capture_output=True, text=True, check=True,
             )
             pgsrip_output = input_file.with_suffix(".srt")
@@ -607,17 +953,22 @@ class SubtitleExtractor:
     # ------------------------------------------------------------------
 
     def _check_existing_subtitles(self, video_file: Path) -> bool:
-        """Return True if a subtitle file already exists for at least one target language."""
-        subtitle_extensions = [".srt", ".ass", ".sup", ".sub", ".ssa"]
-        for lang in self.target_languages:
-            for ext in subtitle_extensions:
-                if (video_file.parent / f"{video_file.stem}.{lang}{ext}").exists():
-                    return True
-            for i in range(1, self.MAX_SUBTITLE_TRACK_INDEX + 1):
-                for ext in subtitle_extensions:
-                    if (video_file.parent / f"{video_file.stem}.{lang}.{i}{ext}").exists():
-                        return True
-        return False
+        """Return True if a subtitle file already exists for at least one target language.
+
+        Tests the precomputed suffix candidates against the subtitle names
+        captured for this directory during the discovery walk — no extra
+        syscalls at all on the common path. Directories the walk never
+        visited (direct process_video_file calls) are listed once here.
+        """
+        names = self._dir_names.get(str(video_file.parent))
+        if names is None:
+            try:
+                with os.scandir(video_file.parent) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                return False
+        stem = video_file.stem
+        return any(f"{stem}{suffix}" in names for suffix in self._existing_sub_suffixes)
 
     # ------------------------------------------------------------------
     # Sync detection
@@ -634,31 +985,78 @@ class SubtitleExtractor:
         Returns ``(offset_seconds, confidence)`` or ``None`` when the check
         cannot run (image subtitle, ffsubsync not installed, or error).
         """
-        # Image-based subtitles have no text timestamps to shift.
-        if subtitle_file.suffix.lower() in (".sup", ".sub"):
+        # Image-based subtitles have no text timestamps to shift. splitext
+        # on the raw string avoids building a PurePath just for the suffix.
+        sub_ext = os.path.splitext(os.fspath(subtitle_file))[1].lower()
+        if sub_ext in self.IMAGE_SUB_SUFFIXES:
             return None
 
-        # Lazy import keeps module startup fast when ffsubsync is absent.
-        from . import sync as sync_module  # noqa: PLC0415
-
-        if not sync_module.HAS_FFSUBSYNC:
+        # Near-empty subtitles (forced-narrative leftovers, failed
+        # extractions) are not worth booting VAD on the whole video.
+        try:
+            if subtitle_file.stat().st_size < self.MIN_SYNC_SUB_BYTES:
+                logging.info(f"  Sync check: skipped (tiny subtitle {subtitle_file.name})")
+                self._bump("sync_skipped_tiny")
+                return None
+            if sub_ext == ".srt":
+                with open(subtitle_file, "rb") as fh:
+                    head = fh.read(4096)
+                if len(_SRT_CUE_RE.findall(head)) < self.MIN_SYNC_SUB_CUES:
+                    logging.info(
+                        f"  Sync check: skipped (no cues found in {subtitle_file.name})"
+                    )
+                    self._bump("sync_skipped_tiny")
+                    return None
+        except OSError:
+            pass  # unreadable here — let the sync pipeline report it
+
+        # Lazy import keeps module startup fast when ffsubsync is absent;
+        # the callables are bound on the first call (after test fixtures or
+        # callers have had the chance to rebind the module attributes).
+        if self._sync_available is None:
+            backend = self.sync_backend
+            if backend is not None:
+                self._sync_available = True
+                self._sync_check = backend.check
+                self._sync_apply = backend.apply
+                self._sync_fix = backend.fix
+            else:
+                from . import sync as sync_module  # noqa: PLC0415
+                self._sync_mod = sync_module
+                self._sync_available = sync_module.HAS_FFSUBSYNC
+                if self._sync_available:
+                    self._sync_check = sync_module.check_sync
+                    self._sync_apply = sync_module.apply_offset
+                    self._sync_fix = sync_module.fix_sync
+
+        if not self._sync_available:
             return None
 
         try:
-            offset, confidence = sync_module.check_sync(video_file, subtitle_file)
+            offset, confidence = self._sync_check(
+                video_file, subtitle_file, vad=self.vad_backend
+            )
         except Exception as exc:
             logging.debug(f"Sync check error: {exc}")
             return (0.0, 0.0)
 
+        self._sync_offsets.append(offset)
+        self._sync_confs.append(confidence)
+
+        # Decision values hoisted into locals: the branches below read each
+        # of them up to twice per file.
+        off_target = abs(offset) >= self.sync_threshold
+        confident = confidence >= 0.3
+
         # ------------------------------------------------------------------
         # Log the result
         # ------------------------------------------------------------------
-        if confidence < 0.3:
+        if not confident:
             logging.info(
                 f"  Sync check: low confidence ({confidence:.0%}) — "
                 "audio may be music-only or silent"
             )
-        elif abs(offset) < self.sync_threshold:
+        elif not off_target:
             logging.info(
                 f"  Sync check: in sync (offset {offset:+.2f}s, confidence {confidence:.0%})"
             )
@@ -668,35 +1066,122 @@ class SubtitleExtractor:
                 f"  Sync check: offset {offset:+.2f}s (confidence {confidence:.0%})"
                 f" \u2190 {direction}"
             )
-            with self._lock:
-                self.stats["sync_issues"] += 1
+            self._bump("sync_issues")
 
         # ------------------------------------------------------------------
         # Apply fix when requested and conditions are met
         # ------------------------------------------------------------------
-        if (
-            self.fix_sync
-            and confidence >= 0.3
-            and abs(offset) >= self.sync_threshold
-        ):
+        if self.fix_sync and confident and off_target:
             if self.dry_run:
                 logging.info(
                     f"  [DRY-RUN] Would fix sync: {subtitle_file.name} offset {offset:+.2f}s"
                 )
             else:
-                if sync_module.fix_sync(video_file, subtitle_file):
+                # Reuse the offset measured above: a direct timestamp shift
+                # skips the second VAD pass. Fall back to a full ffsubsync
+                # run when the shift cannot be applied.
+                fixed = self._sync_apply(subtitle_file, offset) or \
+                    self._sync_fix(video_file, subtitle_file, vad=self.vad_backend)
+                if fixed:
                     logging.info("  Sync: fixed \u2713")
                 else:
                     logging.warning(f"  Sync: fix failed for {subtitle_file.name}")
 
         return offset, confidence
 
+    def _run_sync_check_multi(
+        self, video_file: Path, subtitle_files: List[Path]
+    ) -> List[Optional[Tuple[float, float]]]:
+        """Run sync checks for several subtitles extracted from one video.
+
+        One video commonly yields multiple language tracks. When file
+        processing itself is single-threaded and more than one sync
+        worker is configured, the batch goes through the run_sync_checks
+        process pool (the VAD pass is CPU-bound); under parallel file
+        processing the checks stay sequential so the pools do not
+        oversubscribe the machine.
+        """
+        if (
+            len(subtitle_files) > 1
+            and self.sync_workers > 1
+            and self.threads == 1
+        ):
+            results = self.run_sync_checks(
+                [(video_file, subtitle_file) for subtitle_file in subtitle_files]
+            )
+            return [results.get(subtitle_file) for subtitle_file in subtitle_files]
+        return [
+            self._run_sync_check(video_file, subtitle_file)
+            for subtitle_file in subtitle_files
+        ]
+
+    def run_sync_checks(
+        self, pairs: List[Tuple[Path, Path]]
+    ) -> Dict[Path, Optional[Tuple[float, float]]]:
+        """Run sync checks for *pairs* of (video, subtitle) in parallel.
+
+        The per-file path stays sequential inside process_video_file; this
+        batch helper exists for callers with many already-extracted
+        subtitles to verify. ffsubsync's VAD pass is CPU-bound, so the
+        work goes to a process pool (sync_workers wide) rather than
+        threads. Workers rebuild a minimal extractor from the picklable
+        config; their stats deltas are merged into the parent as each
+        future completes, so ``stats["sync_issues"]`` (and the progress
+        line below) stay live during the batch instead of jumping at the
+        end.
+        """
+        results: Dict[Path, Optional[Tuple[float, float]]] = {}
+        if not pairs:
+            return results
+        total = len(pairs)
+        done = 0
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=self.sync_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._worker_config(), None),
+        ) as executor:
+            future_to_sub = {
+                executor.submit(_check_sync_one, video, subtitle): subtitle
+                for video, subtitle in pairs
+            }
+            for future in as_completed(future_to_sub):
+                subtitle_file = future_to_sub[future]
+                try:
+                    outcome, delta = future.result()
+                except (subprocess.SubprocessError, OSError, ValueError) as exc:
+                    logging.error(f"Sync check failed for {subtitle_file}: {exc}")
+                    outcome, delta = None, {}
+                results[subtitle_file] = outcome
+                done += 1
+                with self._lock:
+                    for key, amount in delta.items():
+                        self.stats[key] += amount
+                    issues = self.stats["sync_issues"]
+                logging.info(
+                    f"Sync checks: {done}/{total} done ({issues} issue(s) so far)"
+                )
+        return results
+
     # ------------------------------------------------------------------
     # Single-file processing
     # ------------------------------------------------------------------
 
     def process_video_file(self, video_file: Path) -> Dict:
         """Process one video file; return a result dict for reporting."""
+        self._local.stats_delta = Counter()
+        try:
+            return self._process_video_file(video_file)
+        finally:
+            delta = self._local.stats_delta
+            self._local.stats_delta = None
+            if delta:
+                with self._lock:
+                    for key, amount in delta.items():
+                        self.stats[key] += amount
+
+    def _process_video_file(self, video_file: Path) -> Dict:
         file_key = str(video_file.absolute())
 
         if self.resume and file_key in self.processed_files:
@@ -708,14 +1193,12 @@ class SubtitleExtractor:
                 if not self.use_rich:
                     logging.info(f"Processing: {video_file}")
                     logging.info("  Skipped: subtitle files already exist (use --overwrite to force)")
-                with self._lock:
-                    self.stats["skipped"] += 1
+                self._bump("skipped")
                 return {"file": str(video_file), "status": "subtitles_exist", "subtitles": []}
 
         if not self.use_rich:
             logging.info(f"Processing: {video_file}")
-        with self._lock:
-            self.stats["processed"] += 1
+        self._bump("processed")
 
         result: Dict = {"file": str(video_file), "status": "processed", "subtitles": [], "errors": []}
 
@@ -728,16 +1211,14 @@ class SubtitleExtractor:
             extract_method = self.extract_subtitle_mp4
         else:
             logging.info(f"  Skipped: unsupported file format ({file_ext})")
-            with self._lock:
-                self.stats["skipped"] += 1
+            self._bump("skipped")
             result["status"] = "unsupported"
             return result
 
         if not subtitle_tracks:
             lang_list = ", ".join(self.target_languages)
             logging.info(f"  Skipped: no subtitles found for language(s): {lang_list}")
-            with self._lock:
-                self.stats["skipped"] += 1
+            self._bump("skipped")
             result["status"] = "no_subtitles"
             return result
 
@@ -747,6 +1228,8 @@ class SubtitleExtractor:
             tracks_by_lang.setdefault(track["language"], []).append(track)
 
         extracted_count = 0
+        # (output_file, sub_entry) pairs awaiting the per-video sync batch.
+        pending_sync: List[Tuple[Path, Dict]] = []
         for lang, lang_tracks in sorted(tracks_by_lang.items()):
             for idx, track in enumerate(lang_tracks):
                 extension = self.get_extension_for_codec(track["codec"])
@@ -757,8 +1240,7 @@ class SubtitleExtractor:
 
                 if output_file.exists() and not self.overwrite:
                     logging.info(f"  Skipped: {output_file.name} already exists")
-                    with self._lock:
-                        self.stats["skipped"] += 1
+                    self._bump("skipped")
                     continue
 
                 if self.dry_run:
@@ -777,8 +1259,7 @@ class SubtitleExtractor:
                     if self.convert_to:
                         final_output = output_file.with_suffix(f".{self.convert_to}")
                         if not self._convert_subtitle(output_file, final_output, track["codec"]):
-                            with self._lock:
-                                self.stats["errors"] += 1
+                            self._bump("errors")
                             result["errors"].append(f"Conversion failed for {output_file.name}")
                             continue
                         output_file = final_output
@@ -788,29 +1269,33 @@ class SubtitleExtractor:
 
                     sub_entry = {"output": str(output_file), "language": lang}
 
-                    # Run sync check/fix for text-based subtitles.
+                    # Sync checks for text-based subtitles are deferred and
+                    # run as one batch per video (see below).
                     if (self.check_sync or self.fix_sync) and \
-                            output_file.suffix.lower() not in (".sup", ".sub"):
-                        sync_result = self._run_sync_check(video_file, output_file)
-                        if sync_result is not None:
-                            sub_entry["sync_offset"] = sync_result[0]
-                            sub_entry["sync_confidence"] = sync_result[1]
+                            output_file.suffix.lower() not in self.IMAGE_SUB_SUFFIXES:
+                        pending_sync.append((output_file, sub_entry))
 
                     result["subtitles"].append(sub_entry)
                     extracted_count += 1
-                    with self._lock:
-                        self.stats["extracted"] += 1
+                    self._bump("extracted")
                 else:
-                    with self._lock:
-                        self.stats["errors"] += 1
+                    self._bump("errors")
                     result["errors"].append(f"Extraction failed for track {track['id']}")
 
+        if pending_sync:
+            outcomes = self._run_sync_check_multi(
+                video_file, [sub for sub, _ in pending_sync]
+            )
+            for (_, sub_entry), outcome in zip(pending_sync, outcomes):
+                if outcome is not None:
+                    sub_entry["sync_offset"] = outcome[0]
+                    sub_entry["sync_confidence"] = outcome[1]
+
         if extracted_count == 0 and subtitle_tracks and not self.dry_run:
             logging.info("  No new subtitles extracted")
 
         if not self.dry_run:
-            with self._lock:
-                self.processed_files.add(file_key)
+            self._mark_processed(file_key)
 
         return result
 
@@ -828,20 +1313,30 @@ class SubtitleExtractor:
         else:
             return {"file": str(video_file), "error": "Unsupported format"}
 
-        evaluated: List[Dict] = []
+        # Columnar (structure-of-arrays) layout: every dict lookup happens
+        # exactly once here, so display_track_list is a plain zip over
+        # equal-length lists with no per-cell .get() calls.
+        info: Dict = {
+            "file": str(video_file),
+            "ids": [],
+            "langs": [],
+            "codecs": [],
+            "forced": [],
+            "names": [],
+            "would_extract": [],
+            "skip_reasons": [],
+        }
         for track in all_tracks:
-            matches, normalized = self._matches_language(track.get("language", ""))
-            should_skip, reason = (
-                self._should_skip_track(track) if matches else (True, "language")
-            )
-            evaluated.append({
-                **track,
-                "would_extract": matches and not should_skip,
-                "skip_reason": reason if matches else "language mismatch",
-                "normalized_language": normalized if matches else track.get("language", "und"),
-            })
+            decision = self._evaluate_track(track)
+            info["ids"].append(track["id"])
+            info["langs"].append(decision.normalized_language)
+            info["codecs"].append(track["codec"])
+            info["forced"].append(track.get("forced", False))
+            info["names"].append(track.get("track_name", "-"))
+            info["would_extract"].append(decision.would_extract)
+            info["skip_reasons"].append(decision.skip_reason)
 
-        return {"file": str(video_file), "tracks": evaluated}
+        return info
 
     def display_track_list(self, track_info: Dict) -> None:
         """Print a formatted table of tracks in *track_info*."""
@@ -853,101 +1348,164 @@ class SubtitleExtractor:
             print(f"Error: {track_info['error']}")
             return
 
-        tracks = track_info.get("tracks", [])
-        if not tracks:
+        if not track_info["ids"]:
             print("No subtitle tracks found")
             return
 
-        if HAS_RICH:
-            try:
-                from rich.console import Console
-                from rich.table import Table
-
-                console = Console()
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("ID", style="cyan", width=6)
-                table.add_column("Language", style="green", width=10)
-                table.add_column("Codec", style="yellow", width=15)
-                table.add_column("Forced", width=8)
-                table.add_column("Track Name", width=25)
-                table.add_column("Will Extract?", width=15)
-
-                for track in tracks:
-                    will_extract = (
-                        "✓ Yes" if track["would_extract"]
-                        else f"✗ No ({track['skip_reason']})"
-                    )
-                    name = track.get("track_name", "-")
-                    if len(name) > 25:
-                        name = name[:22] + "..."
-                    table.add_row(
-                        str(track["id"]),
-                        track.get("normalized_language", track.get("language", "und")),
-                        track["codec"],
-                        "Yes" if track.get("forced", False) else "No",
-                        name,
-                        will_extract,
-                    )
-                console.print(table)
-                return
-            except Exception:
-                pass
-
-        # Fallback plain-text table.
-        print(f"{'ID':<6} {'Lang':<10} {'Codec':<15} {'Forced':<8} {'Track Name':<25} {'Extract?':<15}")
-        print("-" * 80)
-        for track in tracks:
-            will_extract = "Yes" if track["would_extract"] else f"No ({track['skip_reason']})"
-            name = track.get("track_name", "-")
+        rows = zip(
+            track_info["ids"], track_info["langs"], track_info["codecs"],
+            track_info["forced"], track_info["names"],
+            track_info["would_extract"], track_info["skip_reasons"],
+        )
+        # Renderer bound once in __init__; no per-call HAS_RICH branching.
+        self._render_tracks(rows)
+
+    def _render_tracks_rich(self, rows: Iterable[Tuple]) -> None:
+        """Render *rows* as a rich Table (requires HAS_RICH)."""
+        try:
+            table = _build_track_table()
+            for track_id, lang, codec, forced, name, extract, skip_reason in rows:
+                will_extract = "✓ Yes" if extract else f"✗ No ({skip_reason})"
+                if len(name) > 25:
+                    name = name[:22] + "..."
+                table.add_row(
+                    str(track_id),
+                    lang,
+                    codec,
+                    "Yes" if forced else "No",
+                    name,
+                    will_extract,
+                )
+            _get_console().print(table)
+        except Exception:
+            # rich failed at runtime: fall back permanently for this
+            # instance instead of retrying (and re-failing) per file.
+            self._render_tracks = self._render_tracks_plain
+            self._render_tracks_plain(rows)
+
+    def _render_tracks_plain(self, rows: Iterable[Tuple]) -> None:
+        """Render *rows* as a plain-text table via a single stdout write."""
+        lines = [
+            f"{'ID':<6} {'Lang':<10} {'Codec':<15} {'Forced':<8} {'Track Name':<25} {'Extract?':<15}",
+            "-" * 80,
+        ]
+        for track_id, lang, codec, forced, name, extract, skip_reason in rows:
+            will_extract = "Yes" if extract else f"No ({skip_reason})"
             if len(name) > 25:
                 name = name[:22] + "..."
-            print(
-                f"{track['id']:<6} "
-                f"{track.get('normalized_language', track.get('language', 'und')):<10} "
-                f"{track['codec']:<15} "
-                f"{'Yes' if track.get('forced', False) else 'No':<8} "
+            lines.append(
+                f"{track_id:<6} "
+                f"{lang:<10} "
+                f"{codec:<15} "
+                f"{'Yes' if forced else 'No':<8} "
                 f"{name:<25} "
                 f"{will_extract:<15}"
             )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ------------------------------------------------------------------
     # Directory processing
     # ------------------------------------------------------------------
 
+    def _iter_video_files(self, directory: Path) -> Iterator[Path]:
+        """Walk *directory* once, yielding video files as they are found.
+
+        Streaming lets processing start while the walk is still running,
+        instead of paying a full enumerate-and-sort pass upfront on huge
+        trees. A directory's videos are only yielded after its scan
+        completes, so the side tables recorded along the way — subtitle
+        names per directory, .srt stems and sidecar .sup files — are
+        always complete for any yielded file. Files arrive in walk order;
+        construct with ``sort_files=True`` for a deterministic sorted run.
+        """
+        subtitle_exts = {ext[1:] for ext in self.SUBTITLE_EXTENSIONS}
+        self._dir_names = {}
+        self._srt_stems_by_dir = {}
+        self._sup_files = []
+        self._found_mkv = 0
+        self._found_other = 0
+
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            # Empty set even for subtitle-free directories, so
+            # _check_existing_subtitles never has to re-list them.
+            names = self._dir_names.setdefault(current, set())
+            found: List[Path] = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        stem, sep, ext = entry.name.rpartition(".")
+                        if not sep:
+                            continue
+                        ext_lower = ext.lower()
+                        if ext_lower in subtitle_exts:
+                            names.add(entry.name)
+                            if ext_lower == "srt":
+                                self._srt_stems_by_dir.setdefault(current, set()).add(stem)
+                            elif ext_lower == "sup":
+                                self._sup_files.append(Path(entry.path))
+                            continue
+                        if ext_lower == "mkv":
+                            self._found_mkv += 1
+                            found.append(Path(entry.path))
+                        elif "." + ext_lower in self.FFMPEG_FORMATS:
+                            self._found_other += 1
+                            found.append(Path(entry.path))
+            except OSError as exc:
+                logging.debug(f"Cannot scan {current}: {exc}")
+            yield from found
+
+    def _count_discovered(self, stream: Iterator[Path]) -> Iterator[Path]:
+        """Track the running total of discovered files for progress output."""
+        for video_file in stream:
+            self.total_files += 1
+            if self.use_rich and self.progress_bar and self.progress_task is not None:
+                self.progress_bar.update(self.progress_task, total=self.total_files)
+            yield video_file
+
     def process_directory(self, directory: Path) -> None:
         """Recursively find and process all video files under *directory*."""
-        mkv_files = sorted(directory.rglob("*.mkv"))
-        ffmpeg_files: List[Path] = []
-        for ext in ("*.mp4", "*.webm", "*.mov", "*.avi"):
-            ffmpeg_files.extend(directory.rglob(ext))
-        ffmpeg_files = sorted(ffmpeg_files)
-        video_files = sorted(mkv_files + ffmpeg_files)
-
-        # Sidecar .sup files for OCR when convert_to='srt'.
-        sidecar_sups: List[Path] = []
-        if self.convert_to == "srt":
-            for sup_file in sorted(directory.rglob("*.sup")):
-                if not sup_file.with_suffix(".srt").exists() or self.overwrite:
-                    sidecar_sups.append(sup_file)
+        self.base_directory = directory
 
-        if not video_files:
-            logging.info(f"No video files found in {directory}")
-            return
+        if self.sort_files:
+            # Deterministic order (reproducible reports): enumerate fully,
+            # then sort once.
+            sorted_files = sorted(self._iter_video_files(directory))
+            if not sorted_files:
+                logging.info(f"No video files found in {directory}")
+                return
+            self.total_files = len(sorted_files)
+            video_files: Iterable[Path] = sorted_files
+            logging.info(
+                f"Found {self.total_files} total file(s) "
+                f"(MKV: {self._found_mkv}, Other: {self._found_other})\n"
+            )
+        else:
+            # Stream in walk order: processing starts as soon as the first
+            # file is discovered; the total grows as the walk proceeds.
+            stream = self._iter_video_files(directory)
+            first = next(stream, None)
+            if first is None:
+                logging.info(f"No video files found in {directory}")
+                return
+            self.total_files = 0
+            video_files = self._count_discovered(itertools.chain((first,), stream))
 
-        self.base_directory = directory
-        self.total_files = len(video_files)
-        logging.info(
-            f"Found {len(video_files)} total file(s) "
-            f"(MKV: {len(mkv_files)}, Other: {len(ffmpeg_files)})\n"
-        )
-        if sidecar_sups:
-            logging.info(f"Found {len(sidecar_sups)} sidecar .sup file(s) to OCR\n")
         if self.dry_run:
             logging.info("[DRY-RUN MODE] No files will be modified\n")
 
         self.start_time = datetime.now()
+        self.start_ns = time.monotonic_ns()
         logging.info(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
+        if not self.dry_run:
+            self._open_resume_log()
+            self._open_report()
+
         self._init_progress_bar()
 
         if self.use_rich and self.progress_bar:
@@ -962,6 +1520,23 @@ class SubtitleExtractor:
             else:
                 self._process_sequential(video_files)
 
+        if not self.sort_files:
+            logging.info(
+                f"\nFound {self.total_files} total file(s) "
+                f"(MKV: {self._found_mkv}, Other: {self._found_other})"
+            )
+
+        # Sidecar .sup files for OCR when convert_to='srt'. Computed after
+        # the processing loop, once the walk (and its side tables) is
+        # guaranteed complete even in streaming mode.
+        sidecar_sups: List[Path] = []
+        if self.convert_to == "srt":
+            for sup_file in sorted(self._sup_files):
+                if self.overwrite or sup_file.stem not in self._srt_stems_by_dir.get(
+                    str(sup_file.parent), ()
+                ):
+                    sidecar_sups.append(sup_file)
+
         if sidecar_sups and not self.dry_run:
             logging.info("\nProcessing sidecar .sup files with OCR...")
             for sup_file in sidecar_sups:
@@ -976,18 +1551,21 @@ class SubtitleExtractor:
             logging.info(f"\n[DRY-RUN] Would OCR {len(sidecar_sups)} sidecar .sup file(s)")
 
         self.end_time = datetime.now()
+        self.end_ns = time.monotonic_ns()
 
         if not self.dry_run:
-            self._save_resume_state()
+            if self._resume_fh is not None:
+                self._resume_fh.close()
+                self._resume_fh = None
             self._save_reports()
 
-    def _process_sequential(self, video_files: List[Path]) -> None:
+    def _process_sequential(self, video_files: Iterable[Path]) -> None:
         """Process video files one at a time."""
         for video_file in video_files:
             try:
                 self.current_file += 1
                 result = self.process_video_file(video_file)
-                self.extraction_log.append(result)
+                self._record_result(result)
                 self._print_progress()
                 if not self.use_rich:
                     logging.info("")
@@ -998,60 +1576,203 @@ class SubtitleExtractor:
                 if not self.use_rich:
                     logging.info("")
 
-    def _process_parallel(self, video_files: List[Path]) -> None:
-        """Process video files in parallel via a thread pool."""
+    def _worker_config(self) -> Dict:
+        """Return picklable constructor kwargs for process-mode workers.
+
+        Resume and report handling are deliberately left to the parent:
+        workers only extract and return their result/stats.
+        """
+        return {
+            "overwrite": self.overwrite,
+            "languages": list(self.target_languages),
+            "dry_run": self.dry_run,
+            "threads": 1,
+            "include_forced": self.include_forced,
+            "include_sdh": self.include_sdh,
+            "exclude_commentary": self.exclude_commentary,
+            "track_title": self.track_title,
+            "log_file": self.log_file,
+            "convert_to": self.convert_to,
+            "output_dir": self.output_dir,
+            "preserve_structure": self.preserve_structure,
+            "retries": self.retries,
+            "check_sync": self.check_sync,
+            "fix_sync": self.fix_sync,
+            "sync_threshold": self.sync_threshold,
+            # Workers run one file at a time; never nest a sync pool.
+            "sync_workers": 1,
+            "vad_backend": self.vad_backend,
+            "probe_cache_file": self.probe_cache_file,
+        }
+
+    def _process_parallel(self, video_files: Iterable[Path]) -> None:
+        """Process video files in parallel via a thread or process pool."""
+        if self.executor_mode == "process":
+            self._process_parallel_processes(video_files)
+            return
         logging.info(f"Using {self.threads} threads for parallel processing\n")
+        # Keep at most 2*threads futures in flight instead of submitting the
+        # whole backlog upfront: bounds memory on huge libraries and provides
+        # back-pressure against the pool.
+        window = 2 * self.threads
+        remaining = iter(video_files)
         with ThreadPoolExecutor(max_workers=self.threads) as executor:
-            future_to_file = {executor.submit(self.process_video_file, f): f for f in video_files}
-            for future in as_completed(future_to_file):
-                video_file = future_to_file[future]
-                try:
-                    result = future.result()
+            future_to_file = {
+                executor.submit(self.process_video_file, f): f
+                for f in itertools.islice(remaining, window)
+            }
+            while future_to_file:
+                done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+                for future in done:
+                    video_file = future_to_file.pop(future)
+                    try:
+                        result = future.result()
+                        with self._lock:
+                            self.current_file += 1
+                        self._record_result(result)
+                        self._print_progress()
+                        if not self.use_rich:
+                            logging.info("")
+                    except (subprocess.SubprocessError, OSError, ValueError) as exc:
+                        logging.error(f"Unexpected error processing {video_file}: {exc}")
+                        with self._lock:
+                            self.stats["errors"] += 1
+                        if not self.use_rich:
+                            logging.info("")
+                    next_file = next(remaining, None)
+                    if next_file is not None:
+                        future_to_file[
+                            executor.submit(self.process_video_file, next_file)
+                        ] = next_file
+
+    def _process_parallel_processes(self, video_files: Iterable[Path]) -> None:
+        """Process video files via a process pool (true parallelism).
+
+        Threads are the right default for the I/O-bound mkvextract/ffmpeg
+        paths, but OCR and conversion run Python code that holds the GIL;
+        ``--executor process`` sidesteps that. Each worker process builds
+        its own extractor from a picklable config (locks, progress bar and
+        the probe connection cannot cross process boundaries) and returns
+        ``(result, stats_delta)`` for the parent to aggregate.
+        """
+        logging.info(f"Using {self.threads} processes for parallel processing\n")
+        base_directory = getattr(self, "base_directory", None)
+        ctx = multiprocessing.get_context("spawn")
+
+        def submittable() -> Iterator[Path]:
+            """Yield files to submit, handling resume skips in the parent."""
+            for video_file in video_files:
+                file_key = str(video_file.absolute())
+                if self.resume and file_key in self.processed_files:
+                    logging.info(f"Skipped (already processed): {video_file}")
                     with self._lock:
                         self.current_file += 1
-                        self.extraction_log.append(result)
-                    self._print_progress()
-                    if not self.use_rich:
-                        logging.info("")
-                except (subprocess.SubprocessError, OSError, ValueError) as exc:
-                    logging.error(f"Unexpected error processing {video_file}: {exc}")
-                    with self._lock:
-                        self.stats["errors"] += 1
-                    if not self.use_rich:
-                        logging.info("")
+                    self._record_result(
+                        {"file": str(video_file), "status": "resumed_skip", "subtitles": []}
+                    )
+                    continue
+                yield video_file
+
+        # Same bounded 2*threads in-flight window as the thread branch:
+        # submitting the whole discovery stream upfront would buffer every
+        # path (and defer all result handling) on huge libraries.
+        window = 2 * self.threads
+        remaining = submittable()
+        with ProcessPoolExecutor(
+            max_workers=self.threads,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._worker_config(), str(base_directory) if base_directory else None),
+        ) as executor:
+            future_to_file = {
+                executor.submit(_process_one, f): f
+                for f in itertools.islice(remaining, window)
+            }
+            while future_to_file:
+                done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+                for future in done:
+                    video_file = future_to_file.pop(future)
+                    try:
+                        result, delta = future.result()
+                        with self._lock:
+                            self.current_file += 1
+                            for key, amount in delta.items():
+                                self.stats[key] += amount
+                        # Match the in-worker semantics of the other
+                        # executors: skip statuses (subtitles_exist,
+                        # no_subtitles, unsupported) are re-examined on the
+                        # next --resume run, only completed files are not.
+                        if not self.dry_run and result.get("status") == "processed":
+                            self._mark_processed(str(video_file.absolute()))
+                        self._record_result(result)
+                        self._print_progress()
+                        if not self.use_rich:
+                            logging.info("")
+                    except (subprocess.SubprocessError, OSError, ValueError) as exc:
+                        logging.error(f"Unexpected error processing {video_file}: {exc}")
+                        with self._lock:
+                            self.stats["errors"] += 1
+                        if not self.use_rich:
+                            logging.info("")
+                    next_file = next(remaining, None)
+                    if next_file is not None:
+                        future_to_file[
+                            executor.submit(_process_one, next_file)
+                        ] = next_file
 
     # ------------------------------------------------------------------
     # Reports & summary
     # ------------------------------------------------------------------
 
-    def _save_reports(self) -> None:
-        """Write JSON or CSV extraction report if requested."""
-        if not self.report_format or not self.extraction_log:
+    def _open_report(self) -> None:
+        """Open the report file and write its header.
+
+        Entries are streamed as files complete (see _record_result) so the
+        log no longer has to be held in memory for the whole run.
+        """
+        if not self.report_format:
             return
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if self.report_format == "json":
-            report_file = Path(f"subtitle_extraction_{timestamp}.json")
-            with open(report_file, "w") as fh:
-                json.dump(
-                    {"timestamp": timestamp, "stats": self.stats, "files": self.extraction_log},
-                    fh, indent=2,
-                )
-            logging.info(f"\nReport saved to: {report_file}")
-
+            self._report_path = Path(f"subtitle_extraction_{timestamp}.json")
+            self._report_fh = open(self._report_path, "w")
+            self._report_fh.write(f'{{\n  "timestamp": "{timestamp}",\n  "files": [')
+            self._report_first_entry = True
         elif self.report_format == "csv":
-            report_file = Path(f"subtitle_extraction_{timestamp}.csv")
-            with open(report_file, "w", newline="") as fh:
-                writer = csv.writer(fh)
-                writer.writerow(["File", "Status", "Subtitles Extracted", "Errors"])
-                for entry in self.extraction_log:
-                    writer.writerow([
-                        entry["file"],
-                        entry["status"],
-                        len(entry.get("subtitles", [])),
-                        "; ".join(entry.get("errors", [])),
-                    ])
-            logging.info(f"\nReport saved to: {report_file}")
+            self._report_path = Path(f"subtitle_extraction_{timestamp}.csv")
+            self._report_fh = open(self._report_path, "w", newline="")
+            self._report_writer = csv.writer(self._report_fh)
+            self._report_writer.writerow(["File", "Status", "Subtitles Extracted", "Errors"])
+
+    def _record_result(self, result: Dict) -> None:
+        """Stream *result* to the open report, or buffer it when none is open."""
+        if self._report_fh is None:
+            self.extraction_log.append(result)
+            return
+        with self._lock:
+            if self.report_format == "json":
+                prefix = "\n    " if self._report_first_entry else ",\n    "
+                self._report_first_entry = False
+                self._report_fh.write(prefix + _json_dumps(result))
+            else:
+                self._report_writer.writerow([
+                    result["file"],
+                    result["status"],
+                    len(result.get("subtitles", [])),
+                    "; ".join(result.get("errors", [])),
+                ])
+
+    def _save_reports(self) -> None:
+        """Finalize and close the streamed JSON/CSV report, if any."""
+        if self._report_fh is None:
+            return
+        if self.report_format == "json":
+            self._report_fh.write(f'\n  ],\n  "stats": {_json_dumps(self.stats)}\n}}\n')
+        self._report_fh.close()
+        self._report_fh = None
+        self._report_writer = None
+        logging.info(f"\nReport saved to: {self._report_path}")
 
     def print_summary(self) -> None:
         """Print a human-readable extraction summary."""
@@ -1067,12 +1788,24 @@ class SubtitleExtractor:
                 else ""
             )
             logging.info(f"Sync issues found:    {self.stats['sync_issues']}{hint}")
+            if self._sync_offsets:
+                offsets = self._sync_offsets
+                logging.info(
+                    "Sync offsets:         "
+                    f"median {statistics.median(offsets):+.2f}s, "
+                    f"worst {max(offsets, key=abs):+.2f}s "
+                    f"({len(offsets)} checked)"
+                )
         logging.info(f"Files skipped:        {self.stats['skipped']}")
         logging.info(f"Errors encountered:   {self.stats['errors']}")
 
         if self.start_time and self.end_time:
-            duration = self.end_time - self.start_time
-            hours, rem = divmod(int(duration.total_seconds()), 3600)
+            elapsed_s = (
+                (self.end_ns - self.start_ns) // 1_000_000_000
+                if self.start_ns is not None and self.end_ns is not None
+                else int((self.end_time - self.start_time).total_seconds())
+            )
+            hours, rem = divmod(elapsed_s, 3600)
             minutes, seconds = divmod(rem, 60)
             logging.info("")
             logging.info(f"Started:              {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -1083,3 +1816,64 @@ class SubtitleExtractor:
                 logging.info(f"Duration:             {minutes}m {seconds}s")
             else:
                 logging.info(f"Duration:             {seconds}s")
+
+
+@lru_cache(maxsize=512)
+def _match_language_cached(
+    lang_lower: str, targets: Tuple[str, ...]
+) -> Tuple[bool, str]:
+    """Memoized language normalization + target-set membership test.
+
+    Keyed on the already-lowercased code and the extractor's target tuple,
+    so the cache stays valid across extractor instances with different
+    language selections. lru_cache is thread-safe, which the parallel
+    paths rely on.
+    """
+    normalized = SubtitleExtractor.LANGUAGE_CODES.get(lang_lower, lang_lower)
+    return normalized in targets, normalized
+
+
+# ---------------------------------------------------------------------------
+# Process-pool worker plumbing (``--executor process``)
+# ---------------------------------------------------------------------------
+
+# Per-worker extractor instance, created once by _init_worker.
+_WORKER_EXTRACTOR: Optional[SubtitleExtractor] = None
+
+
+def _init_worker(config: Dict, base_directory: Optional[str]) -> None:
+    """Build the per-process extractor from a picklable config."""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = SubtitleExtractor(**config)
+    if base_directory is not None:
+        _WORKER_EXTRACTOR.base_directory = Path(base_directory)
+
+
+def _check_sync_one(
+    video_file: Path, subtitle_file: Path
+) -> Tuple[Optional[Tuple[float, float]], Dict[str, int]]:
+    """Run one sync check in a worker; return the outcome and a stats delta."""
+    extractor = _WORKER_EXTRACTOR
+    assert extractor is not None, "_init_worker did not run"
+    before = dict(extractor.stats)
+    outcome = extractor._run_sync_check(video_file, subtitle_file)
+    delta = {
+        key: value - before[key]
+        for key, value in extractor.stats.items()
+        if value != before[key]
+    }
+    return outcome, delta
+
+
+def _process_one(video_file: Path) -> Tuple[Dict, Dict[str, int]]:
+    """Process one file in a worker; return the result and a stats delta."""
+    extractor = _WORKER_EXTRACTOR
+    assert extractor is not None, "_init_worker did not run"
+    before = dict(extractor.stats)
+    result = extractor.process_video_file(video_file)
+    delta = {
+        key: value - before[key]
+        for key, value in extractor.stats.items()
+        if value != before[key]
+    }
+    return result, delta
@@ -13,26 +13,142 @@ Then use the public helpers::
     offset, confidence = check_sync(Path("video.mkv"), Path("sub.srt"))
     if abs(offset) > 0.5:
         fix_sync(Path("video.mkv"), Path("sub.srt"))
+
+Design note
+-----------
+The VAD timelines and the offset search (an FFT cross-correlation over
+binary speech masks) live entirely inside ffsubsync. This module wraps
+its CLI entry point and never post-processes timelines itself, so there
+is deliberately no numpy/scipy dependency here — vectorizing the
+alignment would mean re-implementing ffsubsync, not speeding this
+wrapper up. The same applies to lower-level schemes (bit-packed VAD
+masks with popcount-based coarse search): they belong below the
+ffsubsync boundary, not in this wrapper.
 """
 
+import atexit
+import importlib.util
+import json
 import logging
+import os
+import re
 import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, List, Match, Optional, Protocol, Tuple
 
 logger = logging.getLogger(__name__)
 
-try:
-    from ffsubsync.ffsubsync import make_parser  # type: ignore[import]
-    from ffsubsync.ffsubsync import run as _ffsubsync_run  # type: ignore[import]
-    HAS_FFSUBSYNC = True
-except ImportError:
-    HAS_FFSUBSYNC = False
+# Presence check only — ffsubsync (and its heavy VAD/ffmpeg dependency
+# chain) is not imported until the first check_sync/fix_sync call.
+HAS_FFSUBSYNC = importlib.util.find_spec("ffsubsync") is not None
+
+# ffsubsync entry points, loaded lazily; the argument parser is built once
+# and reused across calls (building the argparse graph per file is pure
+# overhead in batch runs).
+_PARSER = None
+_RUN = None
+
+
+def _load_ffsubsync():
+    """Import ffsubsync on first use and return ``(parser, run)``."""
+    global _PARSER, _RUN
+    if _RUN is None:
+        from ffsubsync.ffsubsync import make_parser  # type: ignore[import]
+        from ffsubsync.ffsubsync import run  # type: ignore[import]
+        _PARSER = make_parser()
+        _RUN = run
+    return _PARSER, _RUN
+
+
+# ---------------------------------------------------------------------------
+# check_sync result cache
+# ---------------------------------------------------------------------------
+#
+# The VAD + correlation pass costs seconds per file, and iterative runs
+# (threshold tuning, re-runs after partial extraction) hit the same
+# unchanged (video, subtitle) pairs again and again. Results are keyed by
+# (path, st_mtime_ns, st_size) for both files plus the VAD backend, so
+# any edit to either file invalidates the entry, and persisted across
+# runs as JSON.
+
+_StatKey = Tuple[str, int, int]
+
+_CACHE: Dict[Tuple[_StatKey, _StatKey, Optional[str]], Tuple[float, float]] = {}
+_CACHE_PATH = Path.home() / ".cache" / "subtitle_extractor" / "sync.json"
+# Lazy-load/save bookkeeping; plain dict so test monkeypatching is easy.
+_cache_state = {"loaded": False, "dirty": False}
+
+
+def _stat_key(path: Path) -> _StatKey:
+    """Return the (path, mtime_ns, size) cache key for *path*."""
+    st = os.stat(path)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _load_cache() -> None:
+    """Populate _CACHE from disk on first use; missing/corrupt files are fine."""
+    _cache_state["loaded"] = True
+    try:
+        with open(_CACHE_PATH) as fh:
+            entries = json.load(fh)
+        for video_key, sub_key, vad, offset, confidence in entries:
+            _CACHE[(tuple(video_key), tuple(sub_key), vad)] = (offset, confidence)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _save_cache() -> None:
+    """Write _CACHE to disk (atexit hook, registered on first store)."""
+    if not _cache_state["dirty"]:
+        return
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as fh:
+            json.dump(
+                [
+                    [vk, sk, vad, off, conf]
+                    for (vk, sk, vad), (off, conf) in _CACHE.items()
+                ],
+                fh,
+            )
+        tmp_path.replace(_CACHE_PATH)
+        _cache_state["dirty"] = False
+    except OSError as exc:
+        logger.debug("Cannot persist sync cache: %s", exc)
+
+
+def _cache_store(
+    key: Tuple[_StatKey, _StatKey, Optional[str]], result: Tuple[float, float]
+) -> None:
+    """Record *result* and arm the atexit writer on the first store."""
+    if not _cache_state["dirty"]:
+        atexit.register(_save_cache)
+    _CACHE[key] = result
+    _cache_state["dirty"] = True
+
+
+def _colocated_tmp(subtitle_file: Path) -> Path:
+    """Create a temporary file in the subtitle's own directory.
+
+    Keeping the temp file on the same filesystem as the destination makes
+    the final ``Path.replace`` an atomic rename(2) instead of a
+    copy-and-unlink across filesystems (the system tmpdir is often a
+    different mount).
+    """
+    fh = tempfile.NamedTemporaryFile(
+        dir=str(subtitle_file.parent),
+        suffix=subtitle_file.suffix or ".srt",
+        delete=False,
+    )
+    fh.close()
+    return Path(fh.name)
 
 
 def check_sync(
     video_file: Path,
     subtitle_file: Path,
+    vad: Optional[str] = None,
 ) -> Tuple[float, float]:
     """Detect the timing offset between *subtitle_file* and *video_file*.
 
@@ -46,6 +162,9 @@ def check_sync(
         Path to the reference video (any format ffmpeg can read).
     subtitle_file:
         Path to the subtitle file to check (SRT or ASS).
+    vad:
+        Optional ffsubsync VAD backend (``--vad``); ``None`` uses
+        ffsubsync's default (webrtc-based, no torch dependency).
 
     Returns
     -------
@@ -56,20 +175,38 @@ def check_sync(
     - ``confidence`` is between 0.0 and 1.0; higher means more reliable.
 
     Returns ``(0.0, 0.0)`` when ffsubsync is not installed or on any error.
+
+    Successful results are cached by the files' (path, mtime, size) stat
+    keys, in memory and across runs (``~/.cache/subtitle_extractor/
+    sync.json``), so unchanged pairs skip the VAD pass entirely.
     """
     if not HAS_FFSUBSYNC:
         return 0.0, 0.0
 
-    suffix = subtitle_file.suffix or ".srt"
-    tmp_path = Path(tempfile.mktemp(suffix=suffix))
+    cache_key: Optional[Tuple[_StatKey, _StatKey, Optional[str]]] = None
+    try:
+        cache_key = (_stat_key(video_file), _stat_key(subtitle_file), vad)
+    except OSError:
+        pass  # uncacheable; fall through to the pipeline's own error handling
+    if cache_key is not None:
+        if not _cache_state["loaded"]:
+            _load_cache()
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    tmp_path: Optional[Path] = None
     try:
-        parser = make_parser()
-        args = parser.parse_args([
+        tmp_path = _colocated_tmp(subtitle_file)
+        parser, run = _load_ffsubsync()
+        argv = [
             str(video_file),
             "-i", str(subtitle_file),
             "-o", str(tmp_path),
-        ])
-        result = _ffsubsync_run(args)
+        ]
+        if vad is not None:
+            argv += ["--vad", vad]
+        result = run(parser.parse_args(argv))
 
         offset = float(result.get("offset_seconds", 0.0))
         sync_ok = bool(result.get("sync_was_successful", False))
@@ -78,6 +215,11 @@ def check_sync(
         # proxy (0.2) when the internal correlation did not converge.
         confidence = 0.9 if sync_ok else 0.2
 
+        # Only converged results are worth remembering; errors and
+        # low-confidence runs are retried next time.
+        if cache_key is not None and sync_ok:
+            _cache_store(cache_key, (offset, confidence))
+
         return offset, confidence
 
     except Exception as exc:
@@ -85,14 +227,169 @@ def check_sync(
         return 0.0, 0.0
 
     finally:
-        if tmp_path.exists():
+        # unlink directly instead of exists()+unlink: one syscall, and the
+        # missing-file case (tmp already renamed over the original) is the
+        # common one.
+        if tmp_path is not None:
             try:
                 tmp_path.unlink()
             except OSError:
                 pass
 
 
-def fix_sync(video_file: Path, subtitle_file: Path) -> bool:
+class SyncBackend(Protocol):
+    """Interface for pluggable sync implementations.
+
+    The extractor only needs three operations; anything implementing them
+    can be passed as ``SubtitleExtractor(sync_backend=...)``.
+    """
+
+    def check(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> Tuple[float, float]:
+        ...
+
+    def apply(self, subtitle_file: Path, offset_seconds: float) -> bool:
+        ...
+
+    def fix(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> bool:
+        ...
+
+
+class FFSubsyncBackend:
+    """Default backend: thin delegation to this module's functions.
+
+    Delegation happens at call time rather than bind time so rebinding
+    ``sync.check_sync`` (as the test suite does) still takes effect when
+    going through a backend instance.
+    """
+
+    def check(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> Tuple[float, float]:
+        return check_sync(video_file, subtitle_file, vad=vad)
+
+    def apply(self, subtitle_file: Path, offset_seconds: float) -> bool:
+        return apply_offset(subtitle_file, offset_seconds)
+
+    def fix(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> bool:
+        return fix_sync(video_file, subtitle_file, vad=vad)
+
+
+class NullBackend:
+    """Inert backend: reports everything as in sync and fixes nothing."""
+
+    def check(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> Tuple[float, float]:
+        return 0.0, 0.0
+
+    def apply(self, subtitle_file: Path, offset_seconds: float) -> bool:
+        return False
+
+    def fix(
+        self, video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+    ) -> bool:
+        return False
+
+
+def check_sync_multi(
+    video_file: Path,
+    subtitle_files: List[Path],
+    vad: Optional[str] = None,
+) -> List[Tuple[float, float]]:
+    """Check several subtitle files against one reference video.
+
+    ffsubsync's public entry point does not expose the extracted speech
+    timeline, so the reference VAD pass cannot be shared across subtitles
+    in-process. What this helper does reuse: the lazily built argument
+    parser, and the stat-keyed result cache — on re-runs only changed
+    pairs pay for a new pass.
+
+    Returns one ``(offset_seconds, confidence)`` per subtitle, in order.
+    """
+    return [check_sync(video_file, sub, vad=vad) for sub in subtitle_files]
+
+
+# Matches SRT ("00:01:02,345") and ASS ("0:01:02.34") cue timestamps.
+_TIMESTAMP_RE = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})([.,])(\d{2,3})")
+
+
+def _shift_timestamp(match: Match, delta_ms: int) -> str:
+    """Return *match* re-rendered with *delta_ms* added (clamped at zero)."""
+    hours, minutes, seconds, sep, frac = match.groups()
+    frac_ms = int(frac) * (10 if len(frac) == 2 else 1)
+    total = ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + frac_ms
+    total = max(0, total + delta_ms)
+    ms = total % 1000
+    total //= 1000
+    out_s = total % 60
+    total //= 60
+    out_m = total % 60
+    out_h = total // 60
+    # Preserve the source's hour width and fraction precision (ASS uses
+    # centiseconds, SRT uses milliseconds).
+    frac_out = f"{ms // 10:02d}" if len(frac) == 2 else f"{ms:03d}"
+    return f"{out_h:0{len(hours)}d}:{out_m:02d}:{out_s:02d}{sep}{frac_out}"
+
+
+def apply_offset(subtitle_file: Path, offset_seconds: float) -> bool:
+    """Shift every cue timestamp in *subtitle_file* by a known offset, in place.
+
+    This is the fast path for ``fix_sync`` when the offset has already been
+    measured by ``check_sync``: a single linear scan over the text instead
+    of a second full VAD + correlation pass over the video.
+
+    Parameters
+    ----------
+    subtitle_file:
+        SRT or ASS file to correct (modified in place on success).
+    offset_seconds:
+        Detected offset following ``check_sync``'s convention — positive
+        when subtitles are late — so timestamps are shifted by
+        ``-offset_seconds``.
+
+    Returns
+    -------
+    ``True`` on success; ``False`` when the file cannot be read, contains
+    no recognisable timestamps, or the corrected file cannot be written.
+    """
+    delta_ms = -round(offset_seconds * 1000)
+    try:
+        text = subtitle_file.read_text(encoding="utf-8", errors="replace")
+    except OSError as exc:
+        logger.debug("Cannot read %s: %s", subtitle_file, exc)
+        return False
+
+    shifted, count = _TIMESTAMP_RE.subn(
+        lambda m: _shift_timestamp(m, delta_ms), text
+    )
+    if count == 0:
+        logger.debug("No timestamps found in %s", subtitle_file)
+        return False
+
+    # Write next to the original so the final replace is an atomic rename.
+    tmp_path = subtitle_file.with_suffix(subtitle_file.suffix + ".sync.tmp")
+    try:
+        tmp_path.write_text(shifted, encoding="utf-8")
+        tmp_path.replace(subtitle_file)
+        return True
+    except OSError as exc:
+        logger.debug("Cannot write corrected subtitle %s: %s", subtitle_file, exc)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def fix_sync(
+    video_file: Path, subtitle_file: Path, vad: Optional[str] = None
+) -> bool:
     """Detect the timing offset and rewrite *subtitle_file* in place.
 
     Writes corrected timestamps to a temporary file first; only replaces the
@@ -113,16 +410,18 @@ def fix_sync(video_file: Path, subtitle_file: Path) -> bool:
     if not HAS_FFSUBSYNC:
         return False
 
-    suffix = subtitle_file.suffix or ".srt"
-    tmp_path = Path(tempfile.mktemp(suffix=suffix))
+    tmp_path: Optional[Path] = None
     try:
-        parser = make_parser()
-        args = parser.parse_args([
+        tmp_path = _colocated_tmp(subtitle_file)
+        parser, run = _load_ffsubsync()
+        argv = [
             str(video_file),
             "-i", str(subtitle_file),
             "-o", str(tmp_path),
-        ])
-        result = _ffsubsync_run(args)
+        ]
+        if vad is not None:
+            argv += ["--vad", vad]
+        result = run(parser.parse_args(argv))
 
         if result.get("retval", 1) == 0 and tmp_path.exists():
             # Atomically replace original with corrected version.
@@ -136,8 +435,8 @@ def fix_sync(video_file: Path, subtitle_file: Path) -> bool:
         return False
 
     finally:
-        if tmp_path.exists():
+        if tmp_path is not None:
             try:
-                tmp_path.unlink()
+                tmp_path.unlink()  # usually already renamed away; see check_sync
             except OSError:
                 pass
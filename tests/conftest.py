@@ -0,0 +1,19 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from subtitle_extractor.extractor import SubtitleExtractor
+
+
+@pytest.fixture(scope="session")
+def extractor() -> SubtitleExtractor:
+    """Default extractor targeting English.
+
+    Session-scoped: the helpers exercised through this fixture
+    (_should_skip_track, _normalize_languages, _matches_language,
+    get_extension_for_codec, _is_image_based_codec) never mutate the
+    instance, so one shared extractor replaces dozens of constructor
+    calls. Tests that need different constructor arguments, or that
+    touch mutable state such as ``stats``, build their own instance.
+    """
+    return SubtitleExtractor(languages=["en"])
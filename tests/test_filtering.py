@@ -4,25 +4,17 @@ import pytest
 from subtitle_extractor.extractor import SubtitleExtractor
 
 
-def _make_track(
-    forced: bool = False,
-    track_name: str = "",
-    language: str = "en",
-    codec: str = "subrip",
-    track_id: int = 1,
-) -> dict:
-    return {
-        "id": track_id,
-        "codec": codec,
-        "language": language,
-        "forced": forced,
-        "track_name": track_name,
-    }
-
-
-@pytest.fixture
-def extractor() -> SubtitleExtractor:
-    return SubtitleExtractor(languages=["en"])
+_BASE_TRACK = {
+    "id": 1,
+    "codec": "subrip",
+    "language": "en",
+    "forced": False,
+    "track_name": "",
+}
+
+
+def _make_track(**overrides) -> dict:
+    return {**_BASE_TRACK, **overrides}
 
 
 class TestShouldSkipTrack:
@@ -54,11 +46,15 @@ class TestShouldSkipTrack:
     # SDH / CC
     # ------------------------------------------------------------------
 
-    def test_sdh_in_name_skipped_by_default(self, extractor: SubtitleExtractor) -> None:
-        for name in ("English SDH", "SDH English", "CC English", "Hearing Impaired"):
-            skip, reason = extractor._should_skip_track(_make_track(track_name=name))
-            assert skip is True, f"Expected skip for track_name={name!r}"
-            assert reason  # non-empty
+    @pytest.mark.parametrize(
+        "name", ["English SDH", "SDH English", "CC English", "Hearing Impaired"]
+    )
+    def test_sdh_in_name_skipped_by_default(
+        self, extractor: SubtitleExtractor, name: str
+    ) -> None:
+        skip, reason = extractor._should_skip_track(_make_track(track_name=name))
+        assert skip is True
+        assert reason  # non-empty
 
     def test_sdh_included_when_flag_set(self) -> None:
         ext = SubtitleExtractor(include_sdh=True)
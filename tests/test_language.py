@@ -4,12 +4,6 @@ import pytest
 from subtitle_extractor.extractor import SubtitleExtractor
 
 
-@pytest.fixture
-def extractor() -> SubtitleExtractor:
-    """Default extractor targeting English."""
-    return SubtitleExtractor(languages=["en"])
-
-
 class TestNormalizeLanguages:
     def test_iso_639_1_passthrough(self, extractor: SubtitleExtractor) -> None:
         assert extractor._normalize_languages(["en"]) == ["en"]
@@ -40,15 +34,15 @@ class TestNormalizeLanguages:
         result = extractor._normalize_languages(["xyz"])
         assert "xyz" in result
 
-    def test_various_language_codes(self, extractor: SubtitleExtractor) -> None:
-        pairs = [
-            ("spa", "es"), ("fre", "fr"), ("fra", "fr"), ("ger", "de"),
-            ("deu", "de"), ("ita", "it"), ("por", "pt"), ("rus", "ru"),
-            ("jpn", "ja"), ("chi", "zh"), ("zho", "zh"), ("kor", "ko"),
-        ]
-        for code, expected in pairs:
-            result = extractor._normalize_languages([code])
-            assert expected in result, f"{code!r} should normalise to {expected!r}"
+    @pytest.mark.parametrize("code,expected", [
+        ("spa", "es"), ("fre", "fr"), ("fra", "fr"), ("ger", "de"),
+        ("deu", "de"), ("ita", "it"), ("por", "pt"), ("rus", "ru"),
+        ("jpn", "ja"), ("chi", "zh"), ("zho", "zh"), ("kor", "ko"),
+    ])
+    def test_various_language_codes(
+        self, extractor: SubtitleExtractor, code: str, expected: str
+    ) -> None:
+        assert expected in extractor._normalize_languages([code])
 
 
 class TestMatchesLanguage:
@@ -75,8 +69,8 @@ class TestMatchesLanguage:
         matches, _ = extractor._matches_language("ENG")
         assert matches is True
 
-    def test_multi_language_extractor(self) -> None:
+    @pytest.mark.parametrize("code", ["en", "eng", "spa", "fre", "fra"])
+    def test_multi_language_extractor(self, code: str) -> None:
         ext = SubtitleExtractor(languages=["en", "es", "fr"])
-        for code in ("en", "eng", "spa", "fre", "fra"):
-            matches, _ = ext._matches_language(code)
-            assert matches is True, f"{code!r} should match"
+        matches, _ = ext._matches_language(code)
+        assert matches is True
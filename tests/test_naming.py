@@ -6,11 +6,6 @@ import pytest
 from subtitle_extractor.extractor import SubtitleExtractor
 
 
-@pytest.fixture
-def extractor() -> SubtitleExtractor:
-    return SubtitleExtractor(languages=["en"])
-
-
 class TestGetExtensionForCodec:
     def test_subrip(self, extractor: SubtitleExtractor) -> None:
         assert extractor.get_extension_for_codec("subrip") == "srt"
@@ -76,38 +71,50 @@ class TestIsImageBasedCodec:
 
 
 class TestGetOutputPath:
-    def test_single_track_no_index(self, tmp_path: Path) -> None:
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def class_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """One directory for the whole class.
+
+        These tests only compute output paths — the video files are never
+        written — so per-test tmp_path directory churn buys nothing.
+        """
+        return tmp_path_factory.mktemp("naming")
+
+    def test_single_track_no_index(self, class_tmp: Path) -> None:
         ext = SubtitleExtractor(languages=["en"])
-        video = tmp_path / "movie.mkv"
+        video = class_tmp / "movie.mkv"
         out = ext._get_output_path(video, "en", "srt", index=0)
         assert out.name == "movie.en.srt"
-        assert out.parent == tmp_path
+        assert out.parent == class_tmp
 
-    def test_multiple_tracks_with_index(self, tmp_path: Path) -> None:
+    def test_multiple_tracks_with_index(self, class_tmp: Path) -> None:
         ext = SubtitleExtractor(languages=["en"])
-        video = tmp_path / "movie.mkv"
+        video = class_tmp / "movie.mkv"
         out = ext._get_output_path(video, "en", "srt", index=2)
         assert out.name == "movie.en.2.srt"
 
-    def test_custom_output_dir_flat(self, tmp_path: Path) -> None:
-        subs_dir = tmp_path / "subs"
+    def test_custom_output_dir_flat(self, class_tmp: Path) -> None:
+        # Unique subdirectory so the exists() assertion cannot be satisfied
+        # by another test in this class.
+        subs_dir = class_tmp / "subs-flat"
         ext = SubtitleExtractor(languages=["en"], output_dir=subs_dir)
-        video = tmp_path / "movies" / "movie.mkv"
+        video = class_tmp / "movies" / "movie.mkv"
         out = ext._get_output_path(video, "en", "srt", index=0)
         assert out.parent == subs_dir
         assert out.name == "movie.en.srt"
         # Directory should have been created.
         assert subs_dir.exists()
 
-    def test_ass_extension(self, tmp_path: Path) -> None:
+    def test_ass_extension(self, class_tmp: Path) -> None:
         ext = SubtitleExtractor(languages=["en"])
-        video = tmp_path / "show.mkv"
+        video = class_tmp / "show.mkv"
         out = ext._get_output_path(video, "en", "ass", index=0)
         assert out.suffix == ".ass"
 
-    def test_multiple_languages_separate_paths(self, tmp_path: Path) -> None:
+    def test_multiple_languages_separate_paths(self, class_tmp: Path) -> None:
         ext = SubtitleExtractor(languages=["en", "es"])
-        video = tmp_path / "movie.mkv"
+        video = class_tmp / "movie.mkv"
         en_out = ext._get_output_path(video, "en", "srt", index=0)
         es_out = ext._get_output_path(video, "es", "srt", index=0)
         assert en_out.name == "movie.en.srt"
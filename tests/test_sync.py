@@ -6,10 +6,12 @@ run in any CI environment.
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from subtitle_extractor import sync
+from subtitle_extractor.config import validate_config
 from subtitle_extractor.extractor import SubtitleExtractor
 
 
@@ -29,32 +31,150 @@ def _make_extractor(**kwargs) -> SubtitleExtractor:
 class TestSyncModuleNotInstalled:
     """Graceful degradation when ffsubsync is absent."""
 
-    def test_check_sync_returns_zeros(self, tmp_path: Path) -> None:
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", False):
-            from subtitle_extractor import sync
-            offset, confidence = sync.check_sync(
-                tmp_path / "video.mkv",
-                tmp_path / "sub.srt",
-            )
+    def test_check_sync_returns_zeros(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", False)
+        offset, confidence = sync.check_sync(
+            tmp_path / "video.mkv",
+            tmp_path / "sub.srt",
+        )
         assert offset == 0.0
         assert confidence == 0.0
 
-    def test_fix_sync_returns_false(self, tmp_path: Path) -> None:
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", False):
-            from subtitle_extractor import sync
-            result = sync.fix_sync(
-                tmp_path / "video.mkv",
-                tmp_path / "sub.srt",
-            )
+    def test_fix_sync_returns_false(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", False)
+        result = sync.fix_sync(
+            tmp_path / "video.mkv",
+            tmp_path / "sub.srt",
+        )
         assert result is False
 
 
+class TestApplyOffset:
+    """Direct timestamp shifting for a known offset."""
+
+    SRT = (
+        "1\n00:00:10,500 --> 00:00:12,000\nHello\n\n"
+        "2\n00:01:00,000 --> 00:01:02,250\nWorld\n"
+    )
+
+    def test_late_subtitles_shifted_earlier(self, tmp_path: Path) -> None:
+        sub = tmp_path / "sub.srt"
+        sub.write_text(self.SRT)
+        assert sync.apply_offset(sub, 1.0) is True
+        text = sub.read_text()
+        assert "00:00:09,500 --> 00:00:11,000" in text
+        assert "00:00:59,000 --> 00:01:01,250" in text
+
+    def test_early_subtitles_shifted_later(self, tmp_path: Path) -> None:
+        sub = tmp_path / "sub.srt"
+        sub.write_text(self.SRT)
+        assert sync.apply_offset(sub, -0.5) is True
+        assert "00:00:11,000 --> 00:00:12,500" in sub.read_text()
+
+    def test_timestamps_clamped_at_zero(self, tmp_path: Path) -> None:
+        sub = tmp_path / "sub.srt"
+        sub.write_text("1\n00:00:01,000 --> 00:00:02,000\nHi\n")
+        assert sync.apply_offset(sub, 5.0) is True
+        assert "00:00:00,000 --> 00:00:00,000" in sub.read_text()
+
+    def test_ass_centisecond_precision_preserved(self, tmp_path: Path) -> None:
+        sub = tmp_path / "sub.ass"
+        sub.write_text("Dialogue: 0,0:00:10.50,0:00:12.00,Default,,0,0,0,,Hello\n")
+        assert sync.apply_offset(sub, 1.0) is True
+        assert "0:00:09.50,0:00:11.00" in sub.read_text()
+
+    def test_no_timestamps_returns_false(self, tmp_path: Path) -> None:
+        sub = tmp_path / "sub.srt"
+        sub.write_text("dummy")
+        assert sync.apply_offset(sub, 1.0) is False
+        assert sub.read_text() == "dummy"
+
+    def test_missing_file_returns_false(self, tmp_path: Path) -> None:
+        assert sync.apply_offset(tmp_path / "missing.srt", 1.0) is False
+
+
+class TestCheckSyncCache:
+    """check_sync memoizes converged results by file stat keys."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", True)
+        monkeypatch.setattr(sync, "_CACHE", {})
+        monkeypatch.setattr(sync, "_cache_state", {"loaded": True, "dirty": False})
+        monkeypatch.setattr(sync, "_CACHE_PATH", tmp_path / "sync.json")
+        self.run = MagicMock(
+            return_value={"offset_seconds": 1.5, "sync_was_successful": True}
+        )
+        parser = MagicMock()
+        parser.parse_args.return_value = object()
+        monkeypatch.setattr(sync, "_load_ffsubsync", lambda: (parser, self.run))
+
+    def _make_pair(self, tmp_path: Path):
+        video = tmp_path / "video.mkv"
+        sub = tmp_path / "sub.srt"
+        video.write_text("v")
+        sub.write_text("s")
+        return video, sub
+
+    def test_second_call_served_from_cache(self, tmp_path: Path) -> None:
+        video, sub = self._make_pair(tmp_path)
+        first = sync.check_sync(video, sub)
+        second = sync.check_sync(video, sub)
+        assert first == second == (1.5, 0.9)
+        assert self.run.call_count == 1
+
+    def test_unconverged_result_not_cached(self, tmp_path: Path) -> None:
+        video, sub = self._make_pair(tmp_path)
+        self.run.return_value = {"offset_seconds": 0.0, "sync_was_successful": False}
+        sync.check_sync(video, sub)
+        sync.check_sync(video, sub)
+        assert self.run.call_count == 2
+
+    def test_modified_subtitle_invalidates_entry(self, tmp_path: Path) -> None:
+        video, sub = self._make_pair(tmp_path)
+        sync.check_sync(video, sub)
+        sub.write_text("s changed")
+        sync.check_sync(video, sub)
+        assert self.run.call_count == 2
+
+    def test_check_sync_multi_shares_cache(self, tmp_path: Path) -> None:
+        video, sub = self._make_pair(tmp_path)
+        other = tmp_path / "sub.de.srt"
+        other.write_text("s2")
+        results = sync.check_sync_multi(video, [sub, other, sub])
+        assert results == [(1.5, 0.9), (1.5, 0.9), (1.5, 0.9)]
+        # The repeated pair is served from the cache, not re-run.
+        assert self.run.call_count == 2
+
+    def test_cache_round_trips_through_disk(self, tmp_path: Path) -> None:
+        video, sub = self._make_pair(tmp_path)
+        sync.check_sync(video, sub)
+        sync._save_cache()
+        sync._CACHE.clear()
+        sync._cache_state["loaded"] = False
+        assert sync.check_sync(video, sub) == (1.5, 0.9)
+        assert self.run.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests for SubtitleExtractor._run_sync_check
 # ---------------------------------------------------------------------------
 
+def _write_valid_srt(path: Path) -> None:
+    """Write an SRT big enough to pass the tiny-subtitle sync guard."""
+    cues = [
+        f"{i}\n00:0{i}:00,000 --> 00:0{i}:05,000\nLine {i} of dialogue, padded out a bit.\n"
+        for i in range(1, 6)
+    ]
+    path.write_text("\n".join(cues))
+
+
 class TestRunSyncCheckSkipping:
-    """Image-based subtitle files must be silently skipped."""
+    """Image-based and near-empty subtitle files must be silently skipped."""
 
     def test_sup_returns_none(self, tmp_path: Path) -> None:
         ext = _make_extractor()
@@ -66,137 +186,198 @@ class TestRunSyncCheckSkipping:
         result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.sub")
         assert result is None
 
-    def test_returns_none_when_ffsubsync_not_installed(self, tmp_path: Path) -> None:
+    def test_returns_none_when_ffsubsync_not_installed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         ext = _make_extractor()
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", False):
-            result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", False)
+        result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         assert result is None
 
+    def test_tiny_srt_returns_none(self, tmp_path: Path) -> None:
+        ext = _make_extractor()
+        sub = tmp_path / "sub.srt"
+        sub.write_text("dummy")
+        result = ext._run_sync_check(tmp_path / "video.mkv", sub)
+        assert result is None
+        assert ext.stats["sync_skipped_tiny"] == 1
+
+    def test_srt_without_cues_returns_none(self, tmp_path: Path) -> None:
+        ext = _make_extractor()
+        sub = tmp_path / "sub.srt"
+        sub.write_text("no cue headers here, " * 20)  # > MIN_SYNC_SUB_BYTES
+        result = ext._run_sync_check(tmp_path / "video.mkv", sub)
+        assert result is None
+        assert ext.stats["sync_skipped_tiny"] == 1
+
+    def test_valid_srt_reaches_check(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ext = _make_extractor()
+        sub = tmp_path / "sub.srt"
+        _write_valid_srt(sub)
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", True)
+        monkeypatch.setattr(sync, "check_sync", lambda *a, **k: (0.1, 0.9))
+        result = ext._run_sync_check(tmp_path / "video.mkv", sub)
+        assert result == (0.1, 0.9)
+        assert ext.stats["sync_skipped_tiny"] == 0
+
+
+class TestRunSyncCheckMultiDispatch:
+    """Per-video batches use the process pool only when it is safe to."""
+
+    def test_pool_used_when_single_threaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        video = tmp_path / "video.mkv"
+        subs = [tmp_path / "a.srt", tmp_path / "b.srt"]
+        seen = {}
+
+        def fake_pool(self, pairs):
+            seen["pairs"] = pairs
+            return {sub: (1.0, 0.9) for _, sub in pairs}
+
+        monkeypatch.setattr(SubtitleExtractor, "run_sync_checks", fake_pool)
+        ext = _make_extractor(sync_workers=4)  # threads defaults to 1
+        assert ext._run_sync_check_multi(video, subs) == [(1.0, 0.9), (1.0, 0.9)]
+        assert seen["pairs"] == [(video, subs[0]), (video, subs[1])]
+
+    def test_sequential_under_parallel_file_processing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail_pool(self, pairs):
+            raise AssertionError("pool must not be used when threads > 1")
+
+        monkeypatch.setattr(SubtitleExtractor, "run_sync_checks", fail_pool)
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", False)
+        ext = _make_extractor(threads=4, sync_workers=4)
+        video = tmp_path / "video.mkv"
+        subs = [tmp_path / "a.srt", tmp_path / "b.srt"]
+        assert ext._run_sync_check_multi(video, subs) == [None, None]
+
+
+class _PatchedSyncTests:
+    """Shared autouse patching for _run_sync_check tests.
+
+    Patches the sync module once per test via a single undo stack:
+    HAS_FFSUBSYNC is forced on and check_sync is stubbed with a plain
+    closure over ``self.check_ret`` — a MagicMock would be overkill since
+    these tests never introspect the call, only set its return value.
+    Subclasses layer extra patches on top with their own autouse fixture
+    (see TestRunSyncCheckFixBehaviour).
+    """
+
+    @pytest.fixture(autouse=True)
+    def _patch_sync(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("subtitle_extractor.sync.HAS_FFSUBSYNC", True)
+        self.check_ret = (0.0, 0.0)
+        monkeypatch.setattr(
+            "subtitle_extractor.sync.check_sync", lambda *a, **k: self.check_ret
+        )
+
 
-class TestRunSyncCheckStats:
+class TestRunSyncCheckStats(_PatchedSyncTests):
     """sync_issues counter behaviour."""
 
     def test_counter_incremented_when_offset_above_threshold(self, tmp_path: Path) -> None:
         ext = SubtitleExtractor(languages=["en"], check_sync=True, sync_threshold=0.5)
-        mock_check = MagicMock(return_value=(2.34, 0.9))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (2.34, 0.9)
+        ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         assert ext.stats["sync_issues"] == 1
 
+    def test_offset_distribution_recorded(self, tmp_path: Path) -> None:
+        ext = SubtitleExtractor(languages=["en"], check_sync=True, sync_threshold=0.5)
+        self.check_ret = (2.34, 0.9)
+        ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (-0.1, 0.8)
+        ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub2.srt")
+        assert list(ext._sync_offsets) == [2.34, -0.1]
+        assert list(ext._sync_confs) == [0.9, 0.8]
+
     def test_counter_not_incremented_when_below_threshold(self, tmp_path: Path) -> None:
         ext = SubtitleExtractor(languages=["en"], check_sync=True, sync_threshold=0.5)
-        mock_check = MagicMock(return_value=(0.1, 0.9))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (0.1, 0.9)
+        ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         assert ext.stats["sync_issues"] == 0
 
     def test_counter_not_incremented_on_low_confidence(self, tmp_path: Path) -> None:
         ext = SubtitleExtractor(languages=["en"], check_sync=True, sync_threshold=0.5)
-        mock_check = MagicMock(return_value=(3.0, 0.1))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (3.0, 0.1)
+        ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         # Low confidence means we report uncertainty, not a sync issue count.
         assert ext.stats["sync_issues"] == 0
 
 
-class TestRunSyncCheckFixBehaviour:
+class TestRunSyncCheckFixBehaviour(_PatchedSyncTests):
     """Fix is applied only under the right conditions."""
 
-    def test_fix_not_applied_when_below_threshold(self, tmp_path: Path) -> None:
-        ext = SubtitleExtractor(
-            languages=["en"], check_sync=True, fix_sync=True, sync_threshold=0.5
-        )
-        mock_check = MagicMock(return_value=(0.1, 0.9))
-        mock_fix = MagicMock(return_value=True)
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check), \
-             patch("subtitle_extractor.sync.fix_sync", mock_fix):
-            ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
-        mock_fix.assert_not_called()
-
-    def test_fix_applied_when_above_threshold(self, tmp_path: Path) -> None:
-        sub_file = tmp_path / "sub.srt"
-        sub_file.write_text("dummy")
-        ext = SubtitleExtractor(
-            languages=["en"], check_sync=True, fix_sync=True, sync_threshold=0.5
-        )
-        mock_check = MagicMock(return_value=(2.34, 0.9))
-        mock_fix = MagicMock(return_value=True)
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check), \
-             patch("subtitle_extractor.sync.fix_sync", mock_fix):
-            ext._run_sync_check(tmp_path / "video.mkv", sub_file)
-        mock_fix.assert_called_once()
-
-    def test_fix_not_applied_in_dry_run(self, tmp_path: Path) -> None:
+    @pytest.fixture(autouse=True)
+    def _patch_fix(self, _patch_sync, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Layer a fix_sync stub over the shared check_sync patching.
+
+        fix_sync stays a MagicMock: the tests assert on its call count.
+        """
+        self.mock_fix = MagicMock(return_value=True)
+        monkeypatch.setattr("subtitle_extractor.sync.fix_sync", self.mock_fix)
+
+    @pytest.mark.parametrize("check_ret,dry_run,expect_fix", [
+        pytest.param((0.1, 0.9), False, False, id="below-threshold"),
+        pytest.param((2.34, 0.9), False, True, id="above-threshold"),
+        pytest.param((2.34, 0.9), True, False, id="dry-run"),
+        pytest.param((2.34, 0.1), False, False, id="low-confidence"),
+    ])
+    def test_fix_applied_only_when_warranted(
+        self,
+        tmp_path: Path,
+        check_ret: tuple,
+        dry_run: bool,
+        expect_fix: bool,
+    ) -> None:
+        # No file on disk: nothing in the fix path stats it before the
+        # mocked fix_sync fallback runs.
         sub_file = tmp_path / "sub.srt"
-        sub_file.write_text("dummy")
         ext = SubtitleExtractor(
             languages=["en"], check_sync=True, fix_sync=True,
-            sync_threshold=0.5, dry_run=True,
+            sync_threshold=0.5, dry_run=dry_run,
         )
-        mock_check = MagicMock(return_value=(2.34, 0.9))
-        mock_fix = MagicMock(return_value=True)
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check), \
-             patch("subtitle_extractor.sync.fix_sync", mock_fix):
-            ext._run_sync_check(tmp_path / "video.mkv", sub_file)
-        mock_fix.assert_not_called()
-
-    def test_fix_not_applied_on_low_confidence(self, tmp_path: Path) -> None:
-        sub_file = tmp_path / "sub.srt"
-        sub_file.write_text("dummy")
-        ext = SubtitleExtractor(
-            languages=["en"], check_sync=True, fix_sync=True, sync_threshold=0.5
-        )
-        mock_check = MagicMock(return_value=(2.34, 0.1))
-        mock_fix = MagicMock(return_value=True)
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check), \
-             patch("subtitle_extractor.sync.fix_sync", mock_fix):
-            ext._run_sync_check(tmp_path / "video.mkv", sub_file)
-        mock_fix.assert_not_called()
+        self.check_ret = check_ret
+        ext._run_sync_check(tmp_path / "video.mkv", sub_file)
+        if expect_fix:
+            self.mock_fix.assert_called_once()
+        else:
+            self.mock_fix.assert_not_called()
 
 
-class TestRunSyncCheckReturnValue:
+class TestRunSyncCheckReturnValue(_PatchedSyncTests):
     """Return value carries offset and confidence for the report."""
 
     def test_returns_offset_and_confidence(self, tmp_path: Path) -> None:
         ext = _make_extractor()
-        mock_check = MagicMock(return_value=(1.5, 0.85))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (1.5, 0.85)
+        result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         assert result is not None
-        assert result[0] == pytest.approx(1.5)
-        assert result[1] == pytest.approx(0.85)
+        assert result[0] == 1.5
+        assert result[1] == 0.85
 
     def test_returns_negative_offset_for_early_subtitles(self, tmp_path: Path) -> None:
         ext = _make_extractor()
-        mock_check = MagicMock(return_value=(-1.0, 0.9))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (-1.0, 0.9)
+        result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
         assert result is not None
-        assert result[0] == pytest.approx(-1.0)
+        assert result[0] == -1.0
 
 
 # ---------------------------------------------------------------------------
 # Tests for sync data in extraction result dict
 # ---------------------------------------------------------------------------
 
-class TestSyncFieldsInReport:
+class TestSyncFieldsInReport(_PatchedSyncTests):
     """sync_offset and sync_confidence appear in the subtitle entry dict."""
 
     def test_sync_fields_added_when_check_sync_enabled(self, tmp_path: Path) -> None:
         ext = _make_extractor()
-        mock_check = MagicMock(return_value=(2.0, 0.9))
-        with patch("subtitle_extractor.sync.HAS_FFSUBSYNC", True), \
-             patch("subtitle_extractor.sync.check_sync", mock_check):
-            sync_result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
+        self.check_ret = (2.0, 0.9)
+        sync_result = ext._run_sync_check(tmp_path / "video.mkv", tmp_path / "sub.srt")
 
         assert sync_result is not None
         sub_entry = {"output": str(tmp_path / "sub.srt"), "language": "en"}
@@ -205,8 +386,56 @@ class TestSyncFieldsInReport:
 
         assert "sync_offset" in sub_entry
         assert "sync_confidence" in sub_entry
-        assert sub_entry["sync_offset"] == pytest.approx(2.0)
-        assert sub_entry["sync_confidence"] == pytest.approx(0.9)
+        assert sub_entry["sync_offset"] == 2.0
+        assert sub_entry["sync_confidence"] == 0.9
+
+
+class TestSyncBackendInjection:
+    """A custom SyncBackend replaces the module-level functions wholesale."""
+
+    class RecordingBackend:
+        def __init__(self):
+            self.checked = []
+
+        def check(self, video_file, subtitle_file, vad=None):
+            self.checked.append((video_file, subtitle_file))
+            return (1.2, 0.9)
+
+        def apply(self, subtitle_file, offset_seconds):
+            return True
+
+        def fix(self, video_file, subtitle_file, vad=None):
+            return True
+
+    def test_backend_check_used(self, tmp_path: Path) -> None:
+        backend = self.RecordingBackend()
+        ext = SubtitleExtractor(
+            languages=["en"], check_sync=True, sync_backend=backend
+        )
+        sub = tmp_path / "sub.srt"
+        _write_valid_srt(sub)
+        result = ext._run_sync_check(tmp_path / "video.mkv", sub)
+        assert result == (1.2, 0.9)
+        assert backend.checked == [(tmp_path / "video.mkv", sub)]
+
+    def test_backend_used_even_without_ffsubsync(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sync, "HAS_FFSUBSYNC", False)
+        ext = SubtitleExtractor(
+            languages=["en"], check_sync=True, sync_backend=self.RecordingBackend()
+        )
+        sub = tmp_path / "sub.srt"
+        _write_valid_srt(sub)
+        assert ext._run_sync_check(tmp_path / "video.mkv", sub) == (1.2, 0.9)
+
+    def test_null_backend_reports_in_sync(self, tmp_path: Path) -> None:
+        ext = SubtitleExtractor(
+            languages=["en"], check_sync=True, sync_backend=sync.NullBackend()
+        )
+        sub = tmp_path / "sub.srt"
+        _write_valid_srt(sub)
+        assert ext._run_sync_check(tmp_path / "video.mkv", sub) == (0.0, 0.0)
 
 
 # ---------------------------------------------------------------------------
@@ -217,30 +446,24 @@ class TestSyncConfigValidation:
     """New config keys pass validation correctly."""
 
     def test_check_sync_bool_valid(self) -> None:
-        from subtitle_extractor.config import validate_config
         validate_config({"check_sync": True})  # should not raise
 
     def test_fix_sync_bool_valid(self) -> None:
-        from subtitle_extractor.config import validate_config
         validate_config({"fix_sync": False})  # should not raise
 
     def test_sync_threshold_float_valid(self) -> None:
-        from subtitle_extractor.config import validate_config
         validate_config({"sync_threshold": 1.0})  # should not raise
 
     def test_sync_threshold_int_valid(self) -> None:
         # YAML may parse `1` as int; config should accept this.
-        from subtitle_extractor.config import validate_config
         validate_config({"sync_threshold": 1})  # should not raise
 
     def test_sync_threshold_zero_valid(self) -> None:
-        from subtitle_extractor.config import validate_config
         validate_config({"sync_threshold": 0.0})  # should not raise
 
     def test_sync_threshold_negative_invalid(
         self, capsys: pytest.CaptureFixture
     ) -> None:
-        from subtitle_extractor.config import validate_config
         with pytest.raises(SystemExit) as exc_info:
             validate_config({"sync_threshold": -0.5})
         assert exc_info.value.code == 1
@@ -250,12 +473,42 @@ class TestSyncConfigValidation:
     def test_check_sync_wrong_type_invalid(
         self, capsys: pytest.CaptureFixture
     ) -> None:
-        from subtitle_extractor.config import validate_config
         with pytest.raises(SystemExit):
             validate_config({"check_sync": "yes"})  # must be bool
         captured = capsys.readouterr()
         assert "check_sync" in captured.err
 
+    def test_sync_threshold_bool_invalid(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        # bool subclasses int; exact type checks must still reject it.
+        with pytest.raises(SystemExit):
+            validate_config({"sync_threshold": True})
+        captured = capsys.readouterr()
+        assert "sync_threshold" in captured.err
+
+    def test_sync_workers_valid(self) -> None:
+        validate_config({"sync_workers": 4})  # should not raise
+
+    def test_vad_backend_valid(self) -> None:
+        validate_config({"vad_backend": "webrtc"})  # should not raise
+
+    def test_vad_backend_unknown_invalid(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        with pytest.raises(SystemExit):
+            validate_config({"vad_backend": "torchaudio"})
+        captured = capsys.readouterr()
+        assert "vad_backend" in captured.err
+
+    def test_sync_workers_too_low_invalid(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        with pytest.raises(SystemExit):
+            validate_config({"sync_workers": 0})
+        captured = capsys.readouterr()
+        assert "sync_workers" in captured.err
+
 
 # ---------------------------------------------------------------------------
 # Tests for SubtitleExtractor.__init__ sync parameters
@@ -268,7 +521,7 @@ class TestExtractorSyncInit:
         ext = SubtitleExtractor(languages=["en"])
         assert ext.check_sync is False
         assert ext.fix_sync is False
-        assert ext.sync_threshold == pytest.approx(0.5)
+        assert ext.sync_threshold == 0.5
 
     def test_custom_values(self) -> None:
         ext = SubtitleExtractor(
@@ -276,7 +529,7 @@ class TestExtractorSyncInit:
         )
         assert ext.check_sync is True
         assert ext.fix_sync is True
-        assert ext.sync_threshold == pytest.approx(1.5)
+        assert ext.sync_threshold == 1.5
 
     def test_negative_threshold_clamped_to_zero(self) -> None:
         ext = SubtitleExtractor(languages=["en"], sync_threshold=-1.0)